@@ -1,5 +1,5 @@
 from .generation import router as generation_router
 from .export import router as export_router
-from .images import router as images_router
+from .images import router as images_router, uploaded_images
 
-__all__ = ["generation_router", "export_router", "images_router"]
+__all__ = ["generation_router", "export_router", "images_router", "uploaded_images"]
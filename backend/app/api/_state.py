@@ -0,0 +1,109 @@
+"""
+Shared in-memory model store for the API routers.
+
+Models are keyed by their id so exports can look up exactly the model the
+client asked for, even while other sessions keep generating new ones.
+"""
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+import orjson
+from app.models import Model3D
+
+# Maximum number of models kept in memory (least recently used are evicted)
+MAX = 64
+
+MODEL_CACHE: "OrderedDict[str, Model3D]" = OrderedDict()
+
+# Maximum number of compiled aircraft kept for repeat compiles
+COMPILE_MAX = 32
+
+# Compiled models keyed by a digest of their inputs (see compile_key)
+COMPILE_CACHE: "OrderedDict[str, Model3D]" = OrderedDict()
+
+_lock = asyncio.Lock()
+
+
+async def get(model_id: str) -> Optional[Model3D]:
+    """
+    Look up a stored model by id.
+
+    Args:
+        model_id: Id of the model to retrieve
+
+    Returns:
+        Model3D: The stored model
+        None: If the model was never stored or has been evicted
+    """
+    async with _lock:
+        model = MODEL_CACHE.get(model_id)
+        if model is not None:
+            MODEL_CACHE.move_to_end(model_id)
+        return model
+
+
+async def put(model: Model3D) -> None:
+    """
+    Store a model, evicting the least recently used one when full.
+
+    Args:
+        model: Model to store
+    """
+    async with _lock:
+        MODEL_CACHE[model.id] = model
+        MODEL_CACHE.move_to_end(model.id)
+        while len(MODEL_CACHE) > MAX:
+            MODEL_CACHE.popitem(last=False)
+
+
+def compile_key(component_names: tuple, aircraft_data: dict) -> str:
+    """
+    Content address for a compile request.
+
+    Hashes, in assembly order, each component's geometry buffers and the
+    parameters assembly reads - so any change to a mesh or its dimensions
+    gives a new key, whatever ids the client sends.
+
+    Args:
+        component_names: Components being compiled, in assembly order
+        aircraft_data: Full aircraft payload
+
+    Returns:
+        str: Hex digest of the inputs
+    """
+    digest = hashlib.sha256()
+    for name in component_names:
+        component = aircraft_data.get(name) or {}
+        model = component.get("model") or {}
+        geometry = model.get("geometry") or {}
+        digest.update(orjson.dumps(
+            [
+                name,
+                geometry.get("vertices"),
+                geometry.get("indices"),
+                model.get("parameters"),
+                component.get("parameters")
+            ],
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            default=str
+        ))
+    return digest.hexdigest()
+
+
+async def get_compiled(key: str) -> Optional[Model3D]:
+    """Look up a previously compiled model by its compile key."""
+    async with _lock:
+        model = COMPILE_CACHE.get(key)
+        if model is not None:
+            COMPILE_CACHE.move_to_end(key)
+        return model
+
+
+async def put_compiled(key: str, model: Model3D) -> None:
+    """Remember a compiled model, evicting the least recently used one when full."""
+    async with _lock:
+        COMPILE_CACHE[key] = model
+        COMPILE_CACHE.move_to_end(key)
+        while len(COMPILE_CACHE) > COMPILE_MAX:
+            COMPILE_CACHE.popitem(last=False)
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from app.models import ExportRequest
 from app.services import export_service
-from app.api.generation import current_model
+from app.api import _state
 
 router = APIRouter(prefix="/export", tags=["export"])
 
@@ -13,17 +13,54 @@ async def export_stl(request: ExportRequest):
     Export model as STL file.
     """
     # In production, retrieve model from database
-    if current_model is None or current_model.id != request.model_id:
+    model = await _state.get(request.model_id)
+    if model is None:
         raise HTTPException(status_code=404, detail="Model not found")
 
     try:
-        stl_data = export_service.export_stl(current_model, request.options)
-
-        return Response(
-            content=stl_data,
+        if request.options and request.options.binary is False:
+            # ASCII STL is built in one piece
+            return Response(
+                content=export_service.export_stl(model, request.options),
+                media_type="application/sla",
+                headers={
+                    "Content-Disposition": f"attachment; filename={model.name}.stl"
+                }
+            )
+
+        # Binary STL is streamed in chunks instead of being built in memory
+        stl_stream = export_service.iter_stl(model, request.options)
+
+        return StreamingResponse(
+            stl_stream,
             media_type="application/sla",
             headers={
-                "Content-Disposition": f"attachment; filename={current_model.name}.stl"
+                "Content-Disposition": f"attachment; filename={model.name}.stl"
+            }
+        )
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/obj")
+async def export_obj(request: ExportRequest):
+    """
+    Export model as OBJ file.
+    """
+    model = await _state.get(request.model_id)
+    if model is None:
+        raise HTTPException(status_code=404, detail="Model not found")
+
+    try:
+        # Streamed in chunks instead of being built in memory
+        obj_stream = export_service.iter_obj(model)
+
+        return StreamingResponse(
+            obj_stream,
+            media_type="model/obj",
+            headers={
+                "Content-Disposition": f"attachment; filename={model.name}.obj"
             }
         )
 
@@ -37,17 +74,18 @@ async def export_step(request: ExportRequest):
     Export model as STEP file.
     Note: Requires pythonOCC - currently not implemented.
     """
-    if current_model is None or current_model.id != request.model_id:
+    model = await _state.get(request.model_id)
+    if model is None:
         raise HTTPException(status_code=404, detail="Model not found")
 
     try:
-        step_data = export_service.export_step(current_model, request.options)
+        step_data = export_service.export_step(model, request.options)
 
         return Response(
             content=step_data,
             media_type="application/step",
             headers={
-                "Content-Disposition": f"attachment; filename={current_model.name}.step"
+                "Content-Disposition": f"attachment; filename={model.name}.step"
             }
         )
 
@@ -63,17 +101,18 @@ async def export_iges(request: ExportRequest):
     Export model as IGES file.
     Note: Requires pythonOCC - currently not implemented.
     """
-    if current_model is None or current_model.id != request.model_id:
+    model = await _state.get(request.model_id)
+    if model is None:
         raise HTTPException(status_code=404, detail="Model not found")
 
     try:
-        iges_data = export_service.export_iges(current_model, request.options)
+        iges_data = export_service.export_iges(model, request.options)
 
         return Response(
             content=iges_data,
             media_type="application/iges",
             headers={
-                "Content-Disposition": f"attachment; filename={current_model.name}.iges"
+                "Content-Disposition": f"attachment; filename={model.name}.iges"
             }
         )
 
@@ -1,11 +1,48 @@
+import asyncio
+import logging
+from types import MappingProxyType
 from fastapi import APIRouter, HTTPException
-from app.models import GenerateRequest, UpdateParametersRequest, GenerateResponse
+from app.models import (
+    AeroParameters,
+    GenerateRequest,
+    UpdateParametersRequest,
+    CompileAircraftRequest,
+    EditComponentRequest,
+    GenerateResponse
+)
+from app.core import GeometryJSONResponse
 from app.services import ai_service, geometry_service
+from app.api import _state
 
 router = APIRouter(prefix="/generate", tags=["generation"])
 
-# In-memory storage for current model (in production, use database)
-current_model = None
+logger = logging.getLogger(__name__)
+
+# Components required to compile an aircraft, in assembly order
+_COMPONENT_ORDER = ('wings', 'fuselage', 'engines')
+
+# Map edit-command parameter names to AeroParameters field names
+_PARAM_MAPPING = MappingProxyType({
+    'span': 'span',
+    'root_chord': 'root_chord',
+    'tip_chord': 'tip_chord',
+    'sweep_angle': 'sweep_angle',
+    'sweep': 'sweep_angle',
+    'thickness': 'thickness',
+    'dihedral': 'dihedral',
+    'fuselage_length': 'fuselage_length',
+    'fuselage_diameter': 'fuselage_diameter',
+    'engine_length': 'engine_length',
+    'engine_diameter': 'engine_diameter'
+})
+
+# Dimensional parameters scaled by a "scale" edit, per component
+# (root/tip chord track fuselage/engine length for those components)
+_SCALE_KEYS = MappingProxyType({
+    "wings": ("span", "root_chord", "tip_chord"),
+    "fuselage": ("fuselage_length", "fuselage_diameter", "root_chord", "tip_chord"),
+    "engines": ("engine_length", "engine_diameter", "root_chord", "tip_chord")
+})
 
 
 @router.post("/from-text", response_model=GenerateResponse)
@@ -17,25 +54,25 @@ async def generate_from_text(request: GenerateRequest):
         # Extract parameters from text using OpenAI
         parameters = await ai_service.extract_parameters_from_text(request.prompt)
 
-        # Generate 3D model from parameters
-        model = geometry_service.create_model_from_parameters(
+        # Generate 3D model from parameters (CPU-bound, keep it off the event loop)
+        model = await asyncio.to_thread(
+            geometry_service.create_model_from_parameters,
             params=parameters,
             source_prompt=request.prompt,
             generated_from="text"
         )
 
         # Store in memory (temporary)
-        global current_model
-        current_model = model
+        await _state.put(model)
 
-        return GenerateResponse(
+        return GeometryJSONResponse(GenerateResponse(
             success=True,
-            model=model,
+            model=geometry_service.encode_model(model, request.precision),
             parameters=parameters
-        )
+        ))
 
     except Exception as e:
-        print(f"Error generating from text: {e}")
+        logger.exception("error generating from text", extra={"prompt": request.prompt})
         return GenerateResponse(
             success=False,
             error=str(e)
@@ -48,25 +85,25 @@ async def update_parameters(request: UpdateParametersRequest):
     Update current model with new parameters.
     """
     try:
-        # Generate new model with updated parameters
-        model = geometry_service.create_model_from_parameters(
+        # Generate new model with updated parameters (CPU-bound, keep it off the event loop)
+        model = await asyncio.to_thread(
+            geometry_service.create_model_from_parameters,
             params=request.parameters,
             source_prompt=None,
             generated_from="manual"
         )
 
         # Store in memory
-        global current_model
-        current_model = model
+        await _state.put(model)
 
-        return GenerateResponse(
+        return GeometryJSONResponse(GenerateResponse(
             success=True,
-            model=model,
+            model=geometry_service.encode_model(model, request.precision),
             parameters=request.parameters
-        )
+        ))
 
     except Exception as e:
-        print(f"Error updating parameters: {e}")
+        logger.exception("error updating parameters")
         return GenerateResponse(
             success=False,
             error=str(e)
@@ -89,9 +126,7 @@ async def generate_from_chat(request: GenerateRequest):
         }
 
     except Exception as e:
-        print(f"Error generating from chat: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("error generating from chat", extra={"prompt": request.prompt})
         return {
             "success": False,
             "error": str(e)
@@ -99,45 +134,48 @@ async def generate_from_chat(request: GenerateRequest):
 
 
 @router.post("/compile-aircraft", response_model=GenerateResponse)
-async def compile_aircraft(request: dict):
+async def compile_aircraft(request: CompileAircraftRequest):
     """
     Compile all aircraft components into a single unified model.
     """
     try:
-        aircraft_data = request.get('aircraft', {})
-
-        # Extract all component models
-        components = []
-        component_names = []
+        aircraft_data = request.aircraft.model_dump(exclude_none=True)
 
-        for component_type in ['wings', 'fuselage', 'engines']:
-            component = aircraft_data.get(component_type)
-            if component and component.get('model'):
-                components.append(component['model'])
-                component_names.append(component_type)
-
-        if len(components) < 3:
+        # Every component must have a generated model
+        missing = [k for k in _COMPONENT_ORDER if not (aircraft_data.get(k) or {}).get('model')]
+        if missing:
             return GenerateResponse(
                 success=False,
-                error="All 3 components must be generated before compiling"
+                error=f"Missing components: {', '.join(missing)}"
+            )
+
+        # Keep canonical order - the first component's parameters drive assembly
+        component_names = _COMPONENT_ORDER
+        components = [aircraft_data[k]['model'] for k in component_names]
+
+        # Identical inputs compile to the same aircraft - reuse it if we have it
+        key = _state.compile_key(component_names, aircraft_data)
+        compiled_model = await _state.get_compiled(key)
+
+        if compiled_model is None:
+            # Compile the aircraft by merging geometries with AI-powered assembly
+            # (components convert in worker threads while the AI positions them)
+            compiled_model = await geometry_service.compile_aircraft_components(
+                components, component_names, aircraft_data
             )
 
-        # Compile the aircraft by merging geometries with AI-powered assembly
-        compiled_model = await geometry_service.compile_aircraft_components(components, component_names, aircraft_data)
+            await _state.put_compiled(key, compiled_model)
 
         # Store in memory
-        global current_model
-        current_model = compiled_model
+        await _state.put(compiled_model)
 
-        return GenerateResponse(
+        return GeometryJSONResponse(GenerateResponse(
             success=True,
-            model=compiled_model
-        )
+            model=geometry_service.encode_model(compiled_model, request.precision)
+        ))
 
     except Exception as e:
-        print(f"Error compiling aircraft: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("error compiling aircraft")
         return GenerateResponse(
             success=False,
             error=str(e)
@@ -145,7 +183,7 @@ async def compile_aircraft(request: dict):
 
 
 @router.post("/edit-component")
-async def edit_component(request: dict):
+async def edit_component(request: EditComponentRequest):
     """
     Edit a component using natural language commands.
     Supports: size changes, rotation, position, and parameter updates.
@@ -157,8 +195,8 @@ async def edit_component(request: dict):
     - "set wing span to 80 meters"
     """
     try:
-        prompt = request.get('prompt')
-        aircraft_data = request.get('aircraft', {})
+        prompt = request.prompt
+        aircraft_data = request.aircraft.model_dump(exclude_none=True)
 
         if not prompt:
             return {
@@ -174,8 +212,10 @@ async def edit_component(request: dict):
         parameters = edit_instruction.get('parameters', {})
         description = edit_instruction.get('description', '')
 
-        print(f"[EDIT] Component: {component_type}, Operation: {operation}")
-        print(f"[EDIT] Description: {description}")
+        logger.info(
+            "edit parsed",
+            extra={"component": component_type, "operation": operation, "description": description}
+        )
 
         # Get the current component
         component = aircraft_data.get(component_type)
@@ -195,43 +235,30 @@ async def edit_component(request: dict):
             current_params = component.get('parameters', {})
 
             # Convert to AeroParameters format
-            from app.models import AeroParameters
             params_dict = dict(current_params)
 
             # Map parameter names to AeroParameters field names
-            param_mapping = {
-                'span': 'span',
-                'root_chord': 'root_chord',
-                'tip_chord': 'tip_chord',
-                'sweep_angle': 'sweep_angle',
-                'sweep': 'sweep_angle',
-                'thickness': 'thickness',
-                'dihedral': 'dihedral',
-                'fuselage_length': 'fuselage_length',
-                'fuselage_diameter': 'fuselage_diameter',
-                'engine_length': 'engine_length',
-                'engine_diameter': 'engine_diameter'
-            }
-
-            actual_param_name = param_mapping.get(param_name, param_name)
+            actual_param_name = _PARAM_MAPPING.get(param_name, param_name)
             params_dict[actual_param_name] = param_value
 
-            # Regenerate the model with updated parameters
+            # Regenerate the model with updated parameters (geometry is reused for repeated parameters)
             updated_params = AeroParameters(**params_dict)
-            updated_model = geometry_service.create_model_from_parameters(
+            updated_model = await asyncio.to_thread(
+                geometry_service.create_model_from_parameters,
                 params=updated_params,
                 source_prompt=f"Edited via chat: {prompt}",
-                generated_from="edit"
+                generated_from="edit",
+                component=component_type
             )
 
-            return {
+            return GeometryJSONResponse({
                 "success": True,
                 "component": component_type,
                 "operation": operation,
                 "description": description,
-                "model": updated_model,
+                "model": geometry_service.encode_model(updated_model, request.precision),
                 "parameters": updated_params
-            }
+            })
 
         elif operation == "scale":
             # Scale the component by modifying its dimensional parameters
@@ -239,59 +266,32 @@ async def edit_component(request: dict):
 
             # Get current parameters
             current_params = component.get('parameters', {})
-            from app.models import AeroParameters
             params_dict = dict(current_params)
 
             # Scale the appropriate dimensional parameters based on component type
-            if component_type == "wings":
-                # Scale wing dimensions
-                if 'span' in params_dict:
-                    params_dict['span'] = params_dict['span'] * scale_factor
-                if 'root_chord' in params_dict:
-                    params_dict['root_chord'] = params_dict['root_chord'] * scale_factor
-                if 'tip_chord' in params_dict:
-                    params_dict['tip_chord'] = params_dict['tip_chord'] * scale_factor
-
-            elif component_type == "fuselage":
-                # Scale fuselage dimensions
-                if 'fuselage_length' in params_dict and params_dict['fuselage_length']:
-                    params_dict['fuselage_length'] = params_dict['fuselage_length'] * scale_factor
-                if 'fuselage_diameter' in params_dict and params_dict['fuselage_diameter']:
-                    params_dict['fuselage_diameter'] = params_dict['fuselage_diameter'] * scale_factor
-                # Also scale the root/tip chord to match fuselage length
-                if 'root_chord' in params_dict:
-                    params_dict['root_chord'] = params_dict['root_chord'] * scale_factor
-                if 'tip_chord' in params_dict:
-                    params_dict['tip_chord'] = params_dict['tip_chord'] * scale_factor
-
-            elif component_type == "engines":
-                # Scale engine dimensions
-                if 'engine_length' in params_dict and params_dict['engine_length']:
-                    params_dict['engine_length'] = params_dict['engine_length'] * scale_factor
-                if 'engine_diameter' in params_dict and params_dict['engine_diameter']:
-                    params_dict['engine_diameter'] = params_dict['engine_diameter'] * scale_factor
-                # Also scale the root/tip chord to match engine length
-                if 'root_chord' in params_dict:
-                    params_dict['root_chord'] = params_dict['root_chord'] * scale_factor
-                if 'tip_chord' in params_dict:
-                    params_dict['tip_chord'] = params_dict['tip_chord'] * scale_factor
-
-            # Regenerate the model with scaled parameters
+            for key in _SCALE_KEYS.get(component_type, ()):
+                value = params_dict.get(key)
+                if value:
+                    params_dict[key] = value * scale_factor
+
+            # Regenerate the model with scaled parameters (geometry is reused for repeated parameters)
             updated_params = AeroParameters(**params_dict)
-            updated_model = geometry_service.create_model_from_parameters(
+            updated_model = await asyncio.to_thread(
+                geometry_service.create_model_from_parameters,
                 params=updated_params,
                 source_prompt=f"Scaled via chat: {prompt}",
-                generated_from="edit"
+                generated_from="edit",
+                component=component_type
             )
 
-            return {
+            return GeometryJSONResponse({
                 "success": True,
                 "component": component_type,
                 "operation": operation,
                 "description": description,
-                "model": updated_model,
+                "model": geometry_service.encode_model(updated_model, request.precision),
                 "parameters": updated_params
-            }
+            })
 
         elif operation in ["rotate", "translate"]:
             # For geometric transformations, we need to modify the geometry
@@ -308,9 +308,7 @@ async def edit_component(request: dict):
             }
 
     except Exception as e:
-        print(f"Error editing component: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("error editing component", extra={"prompt": request.prompt})
         return {
             "success": False,
             "error": str(e)
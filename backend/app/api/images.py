@@ -1,21 +1,76 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
-from fastapi.responses import FileResponse
-import aiofiles
+from fastapi import APIRouter, Request, UploadFile, File
+from fastapi.responses import FileResponse, Response
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.staticfiles import NotModifiedResponse
+import asyncio
+from collections import OrderedDict
+import hashlib
+import logging
 import os
 from pathlib import Path
-import uuid
+import secrets
+from typing import Optional
 from app.core import settings
 from app.models import ImageUploadResponse
+from app.services.file_writer import write_file
 
 router = APIRouter(prefix="/images", tags=["images"])
 
+logger = logging.getLogger(__name__)
+
 # Ensure upload directory exists
 UPLOAD_DIR = Path(settings.upload_dir)
-UPLOAD_DIR.mkdir(exist_ok=True)
+UPLOAD_DIR.mkdir(mode=0o700, exist_ok=True)
+
+# Read/write size used when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Leading bytes of the accepted image formats (WEBP is checked separately)
+_IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"GIF87a", ".gif"),
+    (b"GIF89a", ".gif"),
+)
+
+# Uploaded files never change once written
+IMAGE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# In-memory cache of recently served images (total bytes, and largest single file)
+HOT_CACHE_MAX_BYTES = 128 * 1024 * 1024
+HOT_CACHE_MAX_FILE = 16 * 1024 * 1024
+
+
+class UploadTooLarge(Exception):
+    """Raised while streaming an upload that exceeds settings.max_upload_size."""
+
+
+def _sniff_image_type(head: bytes) -> Optional[str]:
+    """Return the file extension for a supported image signature, or None."""
+    for magic, ext in _IMAGE_SIGNATURES:
+        if head.startswith(magic):
+            return ext
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return ".webp"
+    return None
+
+
+async def _read_chunks(file: UploadFile, digest, head: bytes = b""):
+    """Yield the upload in chunks, hashing them and stopping once it exceeds the size limit."""
+    total = 0
+    chunk = head or await file.read(UPLOAD_CHUNK_SIZE)
+    while chunk:
+        total += len(chunk)
+        if total > settings.max_upload_size:
+            raise UploadTooLarge()
+        digest.update(chunk)
+        yield chunk
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
 
 
 @router.post("/upload", response_model=ImageUploadResponse)
-async def upload_image(file: UploadFile = File(...)):
+async def upload_image(request: Request, file: UploadFile = File(...)):
     """
     Upload a reference image.
     """
@@ -27,24 +82,34 @@ async def upload_image(file: UploadFile = File(...)):
                 error="File must be an image"
             )
 
-        # Read file
-        contents = await file.read()
+        # Check the actual file signature before touching the disk; it also decides the extension
+        head = await file.read(12)
+        file_ext = _sniff_image_type(head)
+        if file_ext is None:
+            return ImageUploadResponse(
+                success=False,
+                error="Unsupported image format (use JPEG, PNG, GIF or WEBP)"
+            )
 
-        # Validate file size
-        if len(contents) > settings.max_upload_size:
+        # Stream to a temporary file in chunks, hashing and enforcing the size limit as we go
+        temp_path = UPLOAD_DIR / f".{secrets.token_hex(16)}.part"
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            size_hint = int(request.headers.get("content-length", "0") or 0)
+            await write_file(temp_path, _read_chunks(file, digest, head), size_hint)
+        except UploadTooLarge:
             return ImageUploadResponse(
                 success=False,
                 error="File size exceeds 10MB limit"
             )
 
-        # Generate unique filename
-        file_ext = os.path.splitext(file.filename or "image.jpg")[1]
-        unique_filename = f"{uuid.uuid4()}{file_ext}"
+        # Name the file by its content so re-uploads of the same image are stored once
+        unique_filename = f"{digest.hexdigest()}{file_ext}"
         file_path = UPLOAD_DIR / unique_filename
-
-        # Save file
-        async with aiofiles.open(file_path, 'wb') as f:
-            await f.write(contents)
+        if file_path.exists():
+            temp_path.unlink(missing_ok=True)
+        else:
+            os.replace(temp_path, file_path)
 
         # Return URL (in production, use CDN or proper file serving)
         file_url = f"/api/images/{unique_filename}"
@@ -55,21 +120,73 @@ async def upload_image(file: UploadFile = File(...)):
         )
 
     except Exception as e:
-        print(f"Error uploading image: {e}")
+        logger.exception("error uploading image", extra={"upload_filename": file.filename})
         return ImageUploadResponse(
             success=False,
             error=str(e)
         )
 
 
-@router.get("/{filename}")
-async def get_image(filename: str):
+class UploadedImages(StaticFiles):
     """
-    Retrieve an uploaded image.
+    Serves the upload directory.
+
+    Filenames are content hashes, so responses are marked immutable.
+    StaticFiles answers conditional requests with 304 and lets servers that
+    support it send the file with sendfile instead of Python reads.
+
+    Recently served images are also kept in memory (LRU, capped at
+    HOT_CACHE_MAX_BYTES), so repeat fetches skip the stat/open/read entirely.
+    Content-addressed files never change, so cached bytes cannot go stale.
     """
-    file_path = UPLOAD_DIR / filename
 
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Image not found")
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._hot: "OrderedDict[str, tuple[bytes, dict]]" = OrderedDict()
+        self._hot_bytes = 0
+
+    async def get_response(self, path: str, scope) -> Response:
+        request_headers = Headers(scope=scope)
+        # Range requests are left to FileResponse
+        if scope["method"] in ("GET", "HEAD") and path in self._hot and "range" not in request_headers:
+            self._hot.move_to_end(path)
+            body, headers = self._hot[path]
+            if self.is_not_modified(Headers(headers=headers), request_headers):
+                return NotModifiedResponse(Headers(headers=headers))
+            return Response(content=body, headers=headers)
+
+        response = await super().get_response(path, scope)
+
+        # Only a full GET fills the cache (HEAD never needs the body), and that GET is
+        # answered from the bytes just read so the file is not read a second time
+        if (
+            scope["method"] == "GET"
+            and "range" not in request_headers
+            and isinstance(response, FileResponse)
+            and response.status_code == 200
+            and int(response.headers["content-length"]) <= HOT_CACHE_MAX_FILE
+        ):
+            body = await asyncio.to_thread(Path(response.path).read_bytes)
+            headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+            self._remember(path, body, headers)
+            return Response(content=body, headers=headers)
+
+        return response
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = IMAGE_CACHE_CONTROL
+        return response
+
+    def _remember(self, path: str, body: bytes, headers: dict) -> None:
+        if path in self._hot:
+            return
+        self._hot[path] = (body, headers)
+        self._hot_bytes += len(body)
+        while self._hot_bytes > HOT_CACHE_MAX_BYTES:
+            _, (evicted, _) = self._hot.popitem(last=False)
+            self._hot_bytes -= len(evicted)
+
 
-    return FileResponse(file_path)
+# Mounted at /api/images by the app (serves GET /api/images/{filename})
+uploaded_images = UploadedImages(directory=UPLOAD_DIR)
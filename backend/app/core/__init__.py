@@ -1,3 +1,6 @@
 from .config import settings
+from .logging_config import setup_logging, stop_logging
+from .body_limit import BodySizeLimitMiddleware
+from .responses import GeometryJSONResponse
 
-__all__ = ["settings"]
+__all__ = ["settings", "setup_logging", "stop_logging", "BodySizeLimitMiddleware", "GeometryJSONResponse"]
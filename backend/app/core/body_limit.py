@@ -0,0 +1,41 @@
+"""
+Request body size limits.
+
+Rejects oversized uploads from their Content-Length header, before the
+multipart body is read and spooled to disk.
+"""
+import orjson
+
+
+class BodySizeLimitMiddleware:
+    """
+    ASGI middleware answering 413 when a request declares a body over the limit.
+
+    Only requests whose path starts with one of `paths` are checked, so large
+    JSON geometry payloads on other endpoints are unaffected. Bodies without a
+    Content-Length (chunked) pass through and are limited while streaming.
+    """
+
+    def __init__(self, app, max_body_size: int, paths: tuple = ()):
+        self.app = app
+        self.max_body_size = max_body_size
+        self.paths = paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(self.paths):
+            content_length = dict(scope["headers"]).get(b"content-length")
+            if content_length and content_length.isdigit() and int(content_length) > self.max_body_size:
+                body = orjson.dumps({"detail": "File too large"})
+                await send({
+                    "type": "http.response.start",
+                    "status": 413,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode()),
+                        (b"connection", b"close")
+                    ]
+                })
+                await send({"type": "http.response.body", "body": body})
+                return
+
+        await self.app(scope, receive, send)
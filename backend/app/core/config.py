@@ -11,6 +11,10 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = True
+    # Worker processes (ignored with debug reload). Models are stored per process,
+    # so keep 1 unless requests for a model are pinned to one worker
+    workers: int = 1
+    limit_concurrency: int = 256
 
     # CORS
     allowed_origins: List[str] = ["http://localhost:5173", "http://localhost:3000"]
@@ -18,6 +22,12 @@ class Settings(BaseSettings):
     # File Upload
     upload_dir: str = "uploads"
     max_upload_size: int = 10485760  # 10MB
+    odirect_uploads: bool = False  # Write large uploads with O_DIRECT (bypass the page cache)
+
+    # AI response cache (exact prompt matches, persisted across restarts)
+    ai_cache_dir: str = "cache/ai"
+    ai_cache_ttl: int = 7 * 24 * 3600  # Seconds before a cached response expires
+    ai_cache_max_entries: int = 10000  # Oldest responses are deleted beyond this
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,34 @@
+"""
+JSON responses for payloads carrying model geometry.
+
+GeometryData keeps its buffers as numpy arrays. Letting FastAPI serialize a
+response model first turns every vertex into a Python float; orjson can
+instead write the arrays directly.
+"""
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _dump_model(obj):
+    # Python-mode dumps keep numpy buffers as arrays for OPT_SERIALIZE_NUMPY
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class GeometryJSONResponse(JSONResponse):
+    """
+    JSON response rendered by orjson straight from numpy geometry buffers.
+
+    Return it directly from a route (wrapping the usual response model or dict):
+    FastAPI then skips its own response_model serialization. Pydantic models
+    anywhere in the content are dumped on the way.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_dump_model,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
@@ -1,13 +1,54 @@
+import asyncio
+from contextlib import asynccontextmanager
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.core import settings
-from app.api import generation_router, export_router, images_router
+from app.core import settings, setup_logging, stop_logging, BodySizeLimitMiddleware
+from app.api import generation_router, export_router, images_router, uploaded_images
+from app.services import ai_service
+from app.services.ai_cache import prune_disk
+
+# Log through a background queue listener so handlers never block on log I/O
+setup_logging()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background services on startup and stop them on shutdown"""
+    # One pooled keep-alive HTTP client for all OpenAI calls
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=httpx.Timeout(60.0, connect=5.0)  # Fail fast when OpenAI is unreachable
+    )
+    ai_service.use_http_client(app.state.http)
+    # Pre-establish the OpenAI connection in the background (keep a reference to the task)
+    app.state.warm_up = asyncio.create_task(ai_service.warm_up())
+    # Trim expired and excess AI cache entries off the event loop
+    app.state.prune_cache = asyncio.create_task(asyncio.to_thread(prune_disk))
+
+    yield
+
+    app.state.warm_up.cancel()
+    await app.state.prune_cache
+    await app.state.http.aclose()
+    stop_logging()
+
 
 # Create FastAPI app
 app = FastAPI(
     title="AeroCraft API",
     description="AI-Powered Aerospace CAD Web Application",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
+)
+
+# Reject oversized uploads before their multipart body is read
+# (small allowance for the multipart framing around the file)
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_body_size=settings.max_upload_size + 64 * 1024,
+    paths=("/api/images/upload",)
 )
 
 # Configure CORS
@@ -24,6 +65,9 @@ app.include_router(generation_router, prefix="/api")
 app.include_router(export_router, prefix="/api")
 app.include_router(images_router, prefix="/api")
 
+# Uploaded images are served as static files (after the routers, so /api/images/upload still routes)
+app.mount("/api/images", uploaded_images, name="images")
+
 
 @app.get("/")
 async def root():
@@ -47,5 +91,7 @@ if __name__ == "__main__":
         "app.main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.debug
+        reload=settings.debug,
+        workers=1 if settings.debug else settings.workers,
+        limit_concurrency=settings.limit_concurrency
     )
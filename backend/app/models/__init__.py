@@ -1,10 +1,15 @@
 from .schemas import (
     AeroParameters,
+    EncodedGeometry,
     GeometryData,
     ModelMetadata,
     Model3D,
     GenerateRequest,
     UpdateParametersRequest,
+    AircraftComponentData,
+    AircraftData,
+    CompileAircraftRequest,
+    EditComponentRequest,
     GenerateResponse,
     ExportOptions,
     ExportRequest,
@@ -13,11 +18,16 @@ from .schemas import (
 
 __all__ = [
     "AeroParameters",
+    "EncodedGeometry",
     "GeometryData",
     "ModelMetadata",
     "Model3D",
     "GenerateRequest",
     "UpdateParametersRequest",
+    "AircraftComponentData",
+    "AircraftData",
+    "CompileAircraftRequest",
+    "EditComponentRequest",
     "GenerateResponse",
     "ExportOptions",
     "ExportRequest",
@@ -1,11 +1,14 @@
-from pydantic import BaseModel, Field
-from typing import Optional, Literal
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, PlainValidator, WithJsonSchema
+from typing import Annotated, Optional, Literal
 from datetime import datetime
 import uuid
+import numpy as np
 
 
 class AeroParameters(BaseModel):
     """Parametric definition of aerospace component"""
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
     wing_type: Literal['delta', 'swept', 'straight', 'tapered']
     span: float = Field(gt=0, description="Wing span in meters")
     root_chord: float = Field(gt=0, description="Root chord length in meters")
@@ -32,24 +35,89 @@ class AeroParameters(BaseModel):
     position_z: Optional[float] = 0.0  # Left/right position offset
 
 
+class EncodedGeometry(BaseModel):
+    """Compact base64 vertex/normal/index buffers for transport (see GeometryData.encoded)"""
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
+    precision: Literal['fp32', 'fp16', 'int16']
+    vertices: str  # base64 little-endian buffer, 3 values per vertex
+    normals: Optional[str] = None
+    # base64 little-endian index buffer, uint16 whenever every vertex index fits
+    indices: Optional[str] = None
+    index_type: Optional[Literal['uint16', 'uint32']] = None
+    # int16 only: per-axis dequantization, value = (q + 32768) / 65535 * scale + offset
+    scale: Optional[list[float]] = None
+    offset: Optional[list[float]] = None
+
+
+def _flat_array(dtype):
+    """
+    Flat, read-only numpy buffer field type.
+
+    Values are stored as contiguous arrays (no per-element Python objects) and
+    only turned into JSON lists when a response is serialized.
+    """
+    def validate(values) -> np.ndarray:
+        array = np.asarray(values, dtype=dtype).ravel()
+        if array.flags.writeable:
+            # Geometry is shared between cached models, so it must never be modified in place
+            array = array.copy()
+            array.flags.writeable = False
+        return array
+
+    item_type = "integer" if np.issubdtype(dtype, np.integer) else "number"
+    return Annotated[
+        np.ndarray,
+        PlainValidator(validate),
+        PlainSerializer(lambda array: array.tolist(), when_used="json"),
+        WithJsonSchema({"type": "array", "items": {"type": item_type}})
+    ]
+
+
+# float64 keeps JSON output at full precision; compact transport is handled by EncodedGeometry
+FloatArray = _flat_array(np.float64)
+IndexArray = _flat_array(np.int32)
+
+
 class GeometryData(BaseModel):
     """3D geometry data"""
-    vertices: list[float]
-    indices: list[int]
-    normals: Optional[list[float]] = None
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
+    vertices: FloatArray
+    indices: IndexArray
+    normals: Optional[FloatArray] = None
+    # When set, vertices/indices/normals are empty and carried in this compact encoding instead
+    encoded: Optional[EncodedGeometry] = None
+
+    @classmethod
+    def from_arrays(cls, vertices, indices, normals=None) -> "GeometryData":
+        """
+        Build geometry from flat or (N, 3) arrays or sequences.
+
+        Buffers are kept as flat numpy arrays; an empty normals buffer is stored as None.
+        """
+        return cls(
+            vertices=vertices,
+            indices=indices,
+            normals=normals if normals is not None and len(normals) else None
+        )
 
 
 class ModelMetadata(BaseModel):
     """Model metadata"""
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
     created_at: datetime
     updated_at: datetime
-    generated_from: Literal['text', 'image', 'manual', 'compilation']
+    generated_from: Literal['text', 'image', 'manual', 'compilation', 'edit']
     source_prompt: Optional[str] = None
 
 
 class Model3D(BaseModel):
     """Complete 3D model"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     name: str
     parameters: AeroParameters
     geometry: GeometryData
@@ -59,11 +127,43 @@ class Model3D(BaseModel):
 class GenerateRequest(BaseModel):
     """Request to generate model from text"""
     prompt: str = Field(min_length=1, description="Text description of aerospace component")
+    precision: Literal['json', 'fp32', 'fp16', 'int16'] = 'json'  # Response geometry encoding
 
 
 class UpdateParametersRequest(BaseModel):
     """Request to update model parameters"""
     parameters: AeroParameters
+    precision: Literal['json', 'fp32', 'fp16', 'int16'] = 'json'  # Response geometry encoding
+
+
+class AircraftComponentData(BaseModel):
+    """Aircraft component as sent by the client (model geometry is passed through as-is)"""
+    model_config = ConfigDict(extra='allow')
+
+    model: Optional[dict] = None
+    parameters: Optional[dict] = None
+
+
+class AircraftData(BaseModel):
+    """Aircraft components as sent by the client"""
+    model_config = ConfigDict(extra='allow')
+
+    wings: Optional[AircraftComponentData] = None
+    fuselage: Optional[AircraftComponentData] = None
+    engines: Optional[AircraftComponentData] = None
+
+
+class CompileAircraftRequest(BaseModel):
+    """Request to compile all components into one aircraft"""
+    aircraft: AircraftData = Field(default_factory=AircraftData)
+    precision: Literal['json', 'fp32', 'fp16', 'int16'] = 'json'  # Response geometry encoding
+
+
+class EditComponentRequest(BaseModel):
+    """Request to edit a component with a natural language command"""
+    prompt: Optional[str] = None
+    aircraft: AircraftData = Field(default_factory=AircraftData)
+    precision: Literal['json', 'fp32', 'fp16', 'int16'] = 'json'  # Response geometry encoding
 
 
 class GenerateResponse(BaseModel):
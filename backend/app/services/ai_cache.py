@@ -0,0 +1,189 @@
+"""
+Exact-match cache for OpenAI JSON chat completions.
+
+Identical requests (same model, prompts and temperature) are answered from an
+in-process LRU, then from JSON files on disk, and only call OpenAI on a miss.
+Responses are cached as JSON text: it is immutable, so hits need no defensive
+copy. A response is only cached once the caller's parser accepts it, so an
+answer that fails validation is never replayed.
+"""
+import asyncio
+import functools
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional
+import orjson
+from app.core import settings
+
+# Bump when prompts or response handling change in a way that invalidates cached answers
+SCHEMA_VERSION = 1
+
+# Maximum number of responses kept in memory
+MEMORY_MAX = 512
+
+# Default response format: any JSON object
+JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+# The disk cache is pruned once at startup and then after every PRUNE_INTERVAL writes
+PRUNE_INTERVAL = 100
+
+_memory: "OrderedDict[str, str]" = OrderedDict()
+_writes_since_prune = 0
+
+
+async def cached_chat(
+    client,
+    model: str,
+    system: str,
+    user: str,
+    temperature: float,
+    response_format: Optional[dict] = None,
+    prompt_cache_key: Optional[str] = None,
+    parse: Callable[[str], Any] = orjson.loads
+) -> Any:
+    """
+    Run a JSON-mode chat completion, reusing earlier identical responses.
+
+    Args:
+        client: AsyncOpenAI client
+        model: Model name
+        system: System prompt
+        user: User prompt
+        temperature: Sampling temperature
+        response_format: OpenAI response format (defaults to plain JSON mode)
+        prompt_cache_key: OpenAI prompt-cache routing key, shared by calls with the
+            same system prompt so they land where its prefix is already cached
+        parse: Turns the JSON text into the result and raises if it is not
+            acceptable (e.g. Model.model_validate_json); defaults to orjson.loads
+
+    Returns:
+        Parsed response (a fresh object the caller may modify)
+    """
+    response_format = response_format or JSON_OBJECT_FORMAT
+    key = _cache_key(model, system, user, temperature, response_format)
+
+    content = _memory.get(key)
+    if content is None:
+        content = await asyncio.to_thread(_read_disk, key)
+
+    if content is not None:
+        try:
+            result = parse(content)
+        except ValueError:
+            # Entry no longer passes validation (e.g. written by an older version) - refetch
+            _memory.pop(key, None)
+            content = None
+
+    if content is None:
+        # The static system prompt goes first so OpenAI can reuse its cached prefix
+        extra = {"prompt_cache_key": prompt_cache_key} if prompt_cache_key else {}
+        response = await client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user}
+            ],
+            temperature=temperature,
+            response_format=response_format,
+            **extra
+        )
+
+        content = response.choices[0].message.content
+        if not content:
+            raise ValueError("Empty response from OpenAI")
+
+        result = parse(content)  # Raises before caching if the answer is invalid
+        await asyncio.to_thread(_write_disk, key, content)
+
+    _memory[key] = content
+    _memory.move_to_end(key)
+    while len(_memory) > MEMORY_MAX:
+        _memory.popitem(last=False)
+
+    return result
+
+
+def _cache_key(model: str, system: str, user: str, temperature: float, response_format: dict) -> str:
+    key = orjson.dumps([
+        SCHEMA_VERSION, model, _prompt_digest(system), user, temperature,
+        response_format
+    ], option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(key, digest_size=20).hexdigest()
+
+
+@functools.lru_cache(maxsize=64)
+def _prompt_digest(system: str) -> str:
+    """Digest of a system prompt (these are module constants, so each is hashed once)."""
+    return hashlib.blake2b(system.encode(), digest_size=20).hexdigest()
+
+
+def _read_disk(key: str) -> Optional[str]:
+    path = Path(settings.ai_cache_dir) / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime > settings.ai_cache_ttl:
+            path.unlink(missing_ok=True)
+            return None
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _write_disk(key: str, content: str) -> None:
+    global _writes_since_prune
+    # Write to a temporary file and rename so readers never see partial entries
+    cache_dir = Path(settings.ai_cache_dir)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_dir / f".{key}.{os.getpid()}.tmp"
+        temp_path.write_text(content, encoding="utf-8")
+        os.replace(temp_path, cache_dir / f"{key}.json")
+    except OSError:
+        return  # The disk cache is best effort
+
+    _writes_since_prune += 1
+    if _writes_since_prune >= PRUNE_INTERVAL:
+        prune_disk()
+
+
+def prune_disk() -> None:
+    """
+    Delete expired entries, then the oldest ones beyond settings.ai_cache_max_entries.
+
+    This scans the whole cache directory, so it runs at startup and every
+    PRUNE_INTERVAL writes rather than on each write.
+    """
+    global _writes_since_prune
+    _writes_since_prune = 0
+    cache_dir = Path(settings.ai_cache_dir)
+    try:
+        _prune_disk(cache_dir)
+    except OSError:
+        pass  # Missing or unreadable cache directory
+
+
+def _prune_disk(cache_dir: Path) -> None:
+    entries = []
+    expiry = time.time() - settings.ai_cache_ttl
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                mtime = entry.stat().st_mtime
+                if mtime < expiry:
+                    os.unlink(entry.path)
+                else:
+                    entries.append((mtime, entry.path))
+            except OSError:
+                continue
+
+    if len(entries) > settings.ai_cache_max_entries:
+        entries.sort()
+        for _, path in entries[:len(entries) - settings.ai_cache_max_entries]:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
@@ -1,18 +1,177 @@
-import json
-from openai import OpenAI
+import asyncio
+import copy
+import functools
+import hashlib
+import logging
+import httpx
+import orjson
+from typing import Optional
+from openai import AsyncOpenAI
 from app.core import settings
 from app.models import AeroParameters
+from app.services.ai_cache import cached_chat
+from app.services.prompt_cache import PromptCache
+
+logger = logging.getLogger(__name__)
+
+
+def _single_flight(kind: str):
+    """
+    Coalesce concurrent identical AI requests.
+
+    While a request is in flight, identical requests (same kind, prompt and,
+    for edits, the same component parameters) await its result instead of
+    issuing their own OpenAI call. Errors propagate to every waiter.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, prompt: str, *args):
+            # The only extra argument is the current aircraft dict (edit commands)
+            context = self._aircraft_snapshot(args[0]) if args else None
+            key = hashlib.sha256(
+                orjson.dumps([kind, prompt, context], option=orjson.OPT_SORT_KEYS, default=str)
+            ).hexdigest()
+
+            future = self._inflight.get(key)
+            if future is not None:
+                return copy.deepcopy(await asyncio.shield(future))
+
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            try:
+                result = await method(self, prompt, *args)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                future.set_exception(e)
+                future.exception()  # Mark retrieved in case nobody else was waiting
+                raise
+            else:
+                future.set_result(result)
+                return result
+            finally:
+                del self._inflight[key]
+
+        return wrapper
+    return decorator
+
+
+def _strict_schema(schema: dict) -> dict:
+    """
+    Adapt a Pydantic JSON schema to OpenAI strict structured-output rules:
+    every property required, no extra properties, no defaults/titles/bounds.
+    Fields with a non-null default are made non-nullable so the default still
+    applies in spirit. Bounds are still enforced by Pydantic validation.
+    """
+    if isinstance(schema, list):
+        return [_strict_schema(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+
+    dropped = {"default", "title", "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"}
+    strict = {key: _strict_schema(value) for key, value in schema.items() if key not in dropped}
+
+    if "properties" in strict:
+        for name, prop in schema["properties"].items():
+            if prop.get("default") is not None and "anyOf" in strict["properties"][name]:
+                branches = [b for b in strict["properties"][name]["anyOf"] if b.get("type") != "null"]
+                if len(branches) == 1:
+                    strict["properties"][name] = {**branches[0], **{
+                        k: v for k, v in strict["properties"][name].items() if k != "anyOf"
+                    }}
+        strict["required"] = list(strict["properties"])
+        strict["additionalProperties"] = False
+    return strict
+
+
+def _aero_parameters_schema() -> dict:
+    """AeroParameters as the AI fills it in (assembly positions are set by the backend)."""
+    schema = AeroParameters.model_json_schema()
+    for name in ("position_x", "position_y", "position_z"):
+        schema["properties"].pop(name, None)
+    return _strict_schema(schema)
+
+
+_AERO_PARAMETERS_SCHEMA = _aero_parameters_schema()
+
+
+def _aero_parameters_dict(content: str) -> dict:
+    """Parse a component answer, rejecting it unless it passes AeroParameters validation."""
+    AeroParameters.model_validate_json(content)
+    return orjson.loads(content)
+
+
+# Structured-output format: the schema constrains field names, types and enums
+_AERO_PARAMETERS_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "AeroParameters", "schema": _AERO_PARAMETERS_SCHEMA, "strict": True}
+}
+
+# System prompts are built once at import and shared by every request
+
+# Shared preamble for aircraft generation prompts (aircraft classes and real-life scale)
+_AIRCRAFT_CLASSES_PROMPT = """You are an aerospace engineering expert. Generate complete aircraft parameters using REAL-LIFE SCALE dimensions.
 
+CRITICAL: Identify the aircraft class first, then use REAL dimensions for that class!
 
-class AIService:
-    def __init__(self):
-        self.client = OpenAI(api_key=settings.openai_api_key)
+AIRCRAFT CLASSES:
+1. COMMERCIAL AIRLINER (747, 777, A380, A320): Wingspan 35-80m, Wing root 12-20m, Fuselage 40-75m × 5-7m
+2. FIGHTER JET (F-22, F-16, F-35): Wingspan 10-15m, Wing root 6-10m, Fuselage 15-20m × 1.5-2m
+3. CARGO (C-130, C-17, An-225): Wingspan 35-90m, Wing root 10-18m, Fuselage 35-85m × 6-8m
+4. PRIVATE/BUSINESS (Cessna, Gulfstream): Wingspan 12-25m, Wing root 3-8m, Fuselage 12-30m × 1.5-2.5m"""
 
-    async def extract_parameters_from_text(self, prompt: str) -> AeroParameters:
-        """
-        Use GPT-4 to extract structured aerospace parameters from natural language.
-        """
-        system_prompt = """You are an aerospace engineering expert. Extract precise parametric values from user descriptions of aircraft components.
+# Per-component parameter rules for aircraft generation
+_COMPONENT_RULES = {
+    "wings": """WINGS - USE REAL-LIFE SCALE:
+- wing_type: based on aircraft
+- span: REAL wingspan for aircraft class (e.g., 747 = 68m, F-22 = 13.5m)
+- root_chord: REAL root chord for aircraft class (e.g., 747 = 15-17m, F-22 = 8m)
+- tip_chord: REAL tip chord (e.g., 747 = 2-4m, F-22 = 2m)
+- sweep_angle: Typical for aircraft type (Commercial 25-35°, Fighter 40-55°)
+- thickness: 10-15
+- dihedral: -5 to 10
+- has_vertical_stabilizer: false, has_horizontal_stabilizer: false
+- All fuselage/engine fields: null""",
+    "fuselage": """FUSELAGE - USE REAL-LIFE SCALE:
+- wing_type: "straight"
+- span: 0.8
+- root_chord: same as fuselage_length
+- tip_chord: same as root_chord
+- sweep_angle: 0
+- thickness: 80-100
+- dihedral: 0
+- fuselage_type: "commercial"/"fighter"/"cargo"/"private"
+- fuselage_length: REAL length (e.g., 747 = 70m, F-22 = 19m, C-130 = 30m, Cessna = 15m)
+- fuselage_diameter: REAL diameter (e.g., 747 = 6.5m, F-22 = 1.8m, C-130 = 3m, Cessna = 1.8m)
+- All engine fields: null""",
+    "engines": """ENGINES - USE REAL-LIFE SCALE:
+- wing_type: "straight"
+- span: 0.6
+- root_chord: same as engine_length
+- tip_chord: same as engine_length
+- sweep_angle: 0
+- thickness: 90
+- dihedral: 0
+- engine_length: REAL length (747 = 5m, F-22 = 5m, C-130 = 4m, Cessna = 2.5m)
+- engine_diameter: REAL diameter (747 = 3.2m [GE90], F-22 = 1.2m, C-130 = 2.5m, Cessna = 0.7m)
+- All fuselage fields: null"""
+}
+
+# Per-component generation prompts
+_SYSTEM_PROMPT_COMPONENT = {
+    component: f"""{_AIRCRAFT_CLASSES_PROMPT}
+
+You must return parameters for the {component.upper()} component only.
+
+{rules}
+
+Return the {component} parameters as a flat JSON object."""
+    for component, rules in _COMPONENT_RULES.items()
+}
+
+# Shared preamble for parameter extraction (component type and aircraft classes)
+_EXTRACT_PREAMBLE = """You are an aerospace engineering expert. Extract precise parametric values from user descriptions of aircraft components.
 
 IMPORTANT: First determine the component type and AIRCRAFT CLASS from the prompt:
 
@@ -43,30 +202,26 @@ AIRCRAFT CLASSES AND REAL-LIFE DIMENSIONS:
    - Wing root chord: 3-8m
    - Wing tip chord: 1-3m
    - Fuselage length: 12-30m
-   - Fuselage diameter: 1.5-2.5m
+   - Fuselage diameter: 1.5-2.5m"""
 
-For WINGS - USE REAL-LIFE SCALE:
-- wing_type: "delta", "swept", "straight", or "tapered"
+# Per-component parameter rules for extraction
+_EXTRACT_RULES = {
+    "wings": """For WINGS - USE REAL-LIFE SCALE:
 - span: REAL-LIFE wingspan based on aircraft class (see above)
 - root_chord: REAL-LIFE root chord based on aircraft class (see above)
 - tip_chord: REAL-LIFE tip chord based on aircraft class (see above)
 - sweep_angle: number (degrees, 0-90) - Commercial: 25-35°, Fighter: 40-55°, Cargo: 20-30°, Private: 0-25°
 - thickness: number (10-15)
 - dihedral: number (degrees, -10 to 10)
-- fuselage_length: null
-- fuselage_diameter: null
-- engine_length: null
-- engine_diameter: null
-
-For FUSELAGE (body/cabin of aircraft) - USE REAL-LIFE SCALE:
-CRITICAL - ALL these fields are REQUIRED:
-- wing_type: "straight" (REQUIRED)
-- span: 0.8 (REQUIRED - use small value)
-- root_chord: same as fuselage_length (REQUIRED for proper alignment)
-- tip_chord: root_chord (REQUIRED - cylindrical) or 70% of root_chord (tapered)
-- sweep_angle: 0 (REQUIRED)
-- thickness: 80-100 (REQUIRED - fuselage is thick/cylindrical)
-- dihedral: 0 (REQUIRED)
+- fuselage and engine fields: null""",
+    "fuselage": """For FUSELAGE (body/cabin of aircraft) - USE REAL-LIFE SCALE:
+- wing_type: "straight"
+- span: 0.8 (small value)
+- root_chord: same as fuselage_length (for proper alignment)
+- tip_chord: root_chord (cylindrical) or 70% of root_chord (tapered)
+- sweep_angle: 0
+- thickness: 80-100 (fuselage is thick/cylindrical)
+- dihedral: 0
 - fuselage_type: Determine from prompt keywords:
   * "commercial" / "airliner" / "passenger" / "Boeing" / "Airbus" / "747" / "777" / "A320" / "A380" → "commercial"
   * "fighter" / "jet fighter" / "F-22" / "F-16" / "F-35" / "military" → "fighter"
@@ -83,20 +238,16 @@ CRITICAL - ALL these fields are REQUIRED:
   * Fighter jet: 1.5-2m (narrow, sleek)
   * Cargo: 6-8m (very wide)
   * Private/business: 1.5-2.5m (medium)
-- engine_length: null
-- engine_diameter: null
-
-For ENGINES (turbine/nacelle) - USE REAL-LIFE SCALE:
-CRITICAL - ALL these fields are REQUIRED:
-- wing_type: "straight" (REQUIRED)
-- span: 0.6 (REQUIRED)
-- root_chord: same as engine_length (REQUIRED for alignment)
-- tip_chord: same as engine_length (REQUIRED)
-- sweep_angle: 0 (REQUIRED)
-- thickness: 90 (REQUIRED)
-- dihedral: 0 (REQUIRED)
-- fuselage_length: null
-- fuselage_diameter: null
+- engine fields: null""",
+    "engines": """For ENGINES (turbine/nacelle) - USE REAL-LIFE SCALE:
+- wing_type: "straight"
+- span: 0.6
+- root_chord: same as engine_length (for alignment)
+- tip_chord: same as engine_length
+- sweep_angle: 0
+- thickness: 90
+- dihedral: 0
+- fuselage fields: null
 - engine_length: REAL-LIFE length based on aircraft class:
   * Commercial airliner (GE90, Trent, PW4000): 4-6m
   * Fighter jet (F119, F110): 4-5m
@@ -106,33 +257,172 @@ CRITICAL - ALL these fields are REQUIRED:
   * Commercial airliner (high-bypass turbofan): 2.5-3.5m (very large!)
   * Fighter jet (low-bypass): 1-1.5m
   * Cargo aircraft: 2-3m
-  * Private/business jet: 0.5-1m
+  * Private/business jet: 0.5-1m"""
+}
 
-ONLY return valid JSON matching these exact field names."""
+# Full extraction prompt, used when the component cannot be told from the request
+_SYSTEM_PROMPT_EXTRACT = "\n\n".join([_EXTRACT_PREAMBLE, *_EXTRACT_RULES.values()])
 
-        try:
-            response = self.client.chat.completions.create(
-                model=settings.openai_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
+# Extraction prompts for requests that clearly name one component
+_SYSTEM_PROMPT_EXTRACT_COMPONENT = {
+    component: f"{_EXTRACT_PREAMBLE}\n\n{rules}"
+    for component, rules in _EXTRACT_RULES.items()
+}
+
+# Request keywords that identify each component
+_EXTRACT_KEYWORDS = {
+    "wings": ("wing",),
+    "fuselage": ("fuselage", "body", "cabin"),
+    "engines": ("engine", "turbine", "nacelle", "turbofan")
+}
+
+_SYSTEM_PROMPT_ASSEMBLY = """You are an aerospace assembly engineer expert. Analyze aircraft components and calculate precise attachment points and positioning.
+
+Your task: Given component dimensions, calculate realistic positioning that ensures:
+1. Proper structural attachment points
+2. No interference between components
+3. Aerodynamically sound positioning
+4. Center of gravity balance
+5. Real-world engineering practices
+
+Return precise positioning data as JSON."""
+
+_SYSTEM_PROMPT_EDIT = """You are an aerospace engineering assistant. Parse natural language commands to edit aircraft components.
+
+Your task: Interpret edit commands and return structured edit instructions.
+
+COMPONENT IDENTIFICATION:
+- "wings" / "wing" → component: "wings"
+- "fuselage" / "body" / "cabin" → component: "fuselage"
+- "engines" / "engine" / "nacelle" → component: "engines"
+
+OPERATION TYPES:
+
+1. SCALE (size changes):
+   - "make bigger", "increase size", "scale up" → scale: 1.2 (20% bigger)
+   - "make smaller", "decrease size", "scale down" → scale: 0.8 (20% smaller)
+   - "double the size" → scale: 2.0
+   - "half the size" → scale: 0.5
+
+2. ROTATE (orientation changes):
+   - "rotate X degrees" → rotation: X degrees
+   - "rotate clockwise/counterclockwise" → rotation: ±15 degrees
+   - Specify axis if mentioned, default to Y axis (yaw)
+
+3. TRANSLATE (position changes):
+   - "move forward" → translate_x: +2.0
+   - "move backward/back" → translate_x: -2.0
+   - "move up" → translate_y: +1.0
+   - "move down" → translate_y: -1.0
+   - "move left" → translate_z: -2.0
+   - "move right" → translate_z: +2.0
+
+4. PARAMETER (specific parameter changes):
+   - "set span to X meters" → parameter: "span", value: X
+   - "set chord to X" → parameter: "root_chord", value: X
+   - "change sweep angle to X" → parameter: "sweep_angle", value: X
+
+Return JSON with this exact structure:
+{
+  "component": "wings|fuselage|engines",
+  "operation": "scale|rotate|translate|parameter",
+  "parameters": {
+    // For scale:
+    "scale_factor": 1.2,
+    // For rotate:
+    "rotation_degrees": 45,
+    "rotation_axis": "x|y|z",
+    // For translate:
+    "translate_x": 2.0,
+    "translate_y": 0.0,
+    "translate_z": 0.0,
+    // For parameter:
+    "parameter_name": "span",
+    "parameter_value": 80
+  },
+  "description": "human-readable description of what will happen"
+}"""
 
-            content = response.choices[0].message.content
-            if not content:
-                raise ValueError("Empty response from OpenAI")
 
-            params_dict = json.loads(content)
-            print(f"AI extracted parameters: {params_dict}")
+class AIService:
+    def __init__(self):
+        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        # Prompts equal after normalization reuse earlier responses instead of calling OpenAI
+        self._prompt_cache = PromptCache(max_entries=1024)
+        # In-flight requests by key, shared by identical concurrent callers
+        self._inflight: dict[str, asyncio.Future] = {}
 
-            # Convert to Pydantic model for validation
-            return AeroParameters(**params_dict)
+    def use_http_client(self, http_client: httpx.AsyncClient) -> None:
+        """
+        Route OpenAI calls through a shared, pooled HTTP client (set up on app startup)
+        so connections and TLS sessions are reused across requests.
+        """
+        self.client = AsyncOpenAI(api_key=settings.openai_api_key, http_client=http_client)
 
+    async def warm_up(self) -> None:
+        """
+        Open a connection to the OpenAI API ahead of the first real request,
+        so it does not pay for the TCP + TLS handshake. Failures are ignored.
+        """
+        try:
+            await self.client.models.list()
         except Exception as e:
-            print(f"Error extracting parameters: {e}")
+            logger.warning("OpenAI warm-up failed: %s", e)
+
+    @staticmethod
+    def _aircraft_snapshot(current_aircraft: dict) -> dict:
+        """Component parameters an edit instruction depends on (prompt cache context)."""
+        return {
+            key: (current_aircraft.get(key) or {}).get('parameters')
+            for key in ('wings', 'fuselage', 'engines')
+        }
+
+    @staticmethod
+    def _extract_component(prompt: str) -> Optional[str]:
+        """Component named by an extraction request, or None if it names none or several."""
+        text = prompt.lower()
+        matches = [
+            component for component, keywords in _EXTRACT_KEYWORDS.items()
+            if any(keyword in text for keyword in keywords)
+        ]
+        return matches[0] if len(matches) == 1 else None
+
+    def _extract_messages(self, prompt: str, component: Optional[str] = None) -> tuple[str, str]:
+        """
+        Build the (system, user) prompts for single-component parameter extraction.
+
+        When the component is known only its rules are sent; otherwise the
+        full prompt covering every component is used.
+        """
+        return _SYSTEM_PROMPT_EXTRACT_COMPONENT.get(component, _SYSTEM_PROMPT_EXTRACT), prompt
+
+    @_single_flight("extract")
+    async def extract_parameters_from_text(self, prompt: str) -> AeroParameters:
+        """
+        Use GPT-4 to extract structured aerospace parameters from natural language.
+        """
+        cached = self._prompt_cache.get("extract", prompt)
+        if cached is not None:
+            return cached
+
+        component = self._extract_component(prompt)
+        system_prompt, user_prompt = self._extract_messages(prompt, component)
+
+        try:
+            # Validated straight from the JSON text (no intermediate dict) before it is cached
+            params = await cached_chat(
+                self.client, settings.openai_model, system_prompt, user_prompt,
+                temperature=0.3, response_format=_AERO_PARAMETERS_FORMAT,
+                prompt_cache_key=f"aero-extract-{component or 'any'}-v1",
+                parse=AeroParameters.model_validate_json
+            )
+            logger.debug("AI extracted parameters: %r", params)
+
+            self._prompt_cache.put("extract", prompt, params)
+            return params
+
+        except Exception:
+            logger.exception("Error extracting parameters, using default delta wing")
             # Return default delta wing on error (much wider chord for better proportions)
             return AeroParameters(
                 wing_type="delta",
@@ -147,89 +437,43 @@ ONLY return valid JSON matching these exact field names."""
             )
 
 
+    def _component_messages(self, component: str, prompt: str) -> tuple[str, str]:
+        """Build the (system, user) prompts for generating a single aircraft component."""
+        return _SYSTEM_PROMPT_COMPONENT[component], prompt
+
+    async def _generate_component(self, component: str, prompt: str) -> dict:
+        """Generate parameters for one component of the described aircraft."""
+        system_prompt, user_prompt = self._component_messages(component, prompt)
+        return await cached_chat(
+            self.client, settings.openai_model, system_prompt, user_prompt,
+            temperature=0.3, response_format=_AERO_PARAMETERS_FORMAT,
+            prompt_cache_key=f"aero-{component}-v1", parse=_aero_parameters_dict
+        )
+
+    @_single_flight("complete")
     async def generate_complete_aircraft(self, prompt: str) -> dict:
         """
         Use GPT-4 to generate parameters for all 3 components (wings, fuselage, engines)
         from a single natural language description.
         Returns a dict with keys: wings, fuselage, engines
         """
-        system_prompt = """You are an aerospace engineering expert. Generate complete aircraft parameters using REAL-LIFE SCALE dimensions.
-
-CRITICAL: Identify the aircraft class first, then use REAL dimensions for that class!
-
-AIRCRAFT CLASSES:
-1. COMMERCIAL AIRLINER (747, 777, A380, A320): Wingspan 35-80m, Wing root 12-20m, Fuselage 40-75m × 5-7m
-2. FIGHTER JET (F-22, F-16, F-35): Wingspan 10-15m, Wing root 6-10m, Fuselage 15-20m × 1.5-2m
-3. CARGO (C-130, C-17, An-225): Wingspan 35-90m, Wing root 10-18m, Fuselage 35-85m × 6-8m
-4. PRIVATE/BUSINESS (Cessna, Gulfstream): Wingspan 12-25m, Wing root 3-8m, Fuselage 12-30m × 1.5-2.5m
-
-You must return parameters for ALL 3 components: wings, fuselage, and engines.
-
-WINGS - USE REAL-LIFE SCALE:
-- wing_type: "delta", "swept", "straight", or "tapered" (based on aircraft)
-- span: REAL wingspan for aircraft class (e.g., 747 = 68m, F-22 = 13.5m)
-- root_chord: REAL root chord for aircraft class (e.g., 747 = 15-17m, F-22 = 8m)
-- tip_chord: REAL tip chord (e.g., 747 = 2-4m, F-22 = 2m)
-- sweep_angle: Typical for aircraft type (Commercial 25-35°, Fighter 40-55°)
-- thickness: 10-15
-- dihedral: -5 to 10
-- has_vertical_stabilizer: false, has_horizontal_stabilizer: false
-- All fuselage/engine fields: null
-
-FUSELAGE - USE REAL-LIFE SCALE:
-- wing_type: "straight"
-- span: 0.8
-- root_chord: same as fuselage_length
-- tip_chord: same as root_chord
-- sweep_angle: 0
-- thickness: 80-100
-- dihedral: 0
-- fuselage_type: "commercial"/"fighter"/"cargo"/"private"
-- fuselage_length: REAL length (e.g., 747 = 70m, F-22 = 19m, C-130 = 30m, Cessna = 15m)
-- fuselage_diameter: REAL diameter (e.g., 747 = 6.5m, F-22 = 1.8m, C-130 = 3m, Cessna = 1.8m)
-- All engine fields: null
-
-ENGINES - USE REAL-LIFE SCALE:
-- wing_type: "straight"
-- span: 0.6
-- root_chord: same as engine_length
-- tip_chord: same as engine_length
-- sweep_angle: 0
-- thickness: 90
-- dihedral: 0
-- engine_length: REAL length (747 = 5m, F-22 = 5m, C-130 = 4m, Cessna = 2.5m)
-- engine_diameter: REAL diameter (747 = 3.2m [GE90], F-22 = 1.2m, C-130 = 2.5m, Cessna = 0.7m)
-- All fuselage fields: null
-
-Return as JSON:
-{
-  "wings": { parameters... },
-  "fuselage": { parameters... },
-  "engines": { parameters... }
-}"""
+        cached = self._prompt_cache.get("complete", prompt)
+        if cached is not None:
+            return cached
 
         try:
-            response = self.client.chat.completions.create(
-                model=settings.openai_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"}
+            # One smaller call per component, run concurrently (latency follows output length)
+            wings, fuselage, engines = await asyncio.gather(
+                *(self._generate_component(c, prompt) for c in _COMPONENT_RULES)
             )
+            aircraft_dict = {"wings": wings, "fuselage": fuselage, "engines": engines}
+            logger.debug("AI generated complete aircraft: %r", aircraft_dict)
 
-            content = response.choices[0].message.content
-            if not content:
-                raise ValueError("Empty response from OpenAI")
-
-            aircraft_dict = json.loads(content)
-            print(f"AI generated complete aircraft: {aircraft_dict}")
-
+            self._prompt_cache.put("complete", prompt, aircraft_dict)
             return aircraft_dict
 
         except Exception as e:
-            print(f"Error generating complete aircraft: {e}")
+            logger.warning("Error generating complete aircraft: %s", e)
             raise
 
 
@@ -244,16 +488,7 @@ Return as JSON:
         Returns:
             Dict with positioning data for each component
         """
-        system_prompt = """You are an aerospace assembly engineer expert. Analyze aircraft components and calculate precise attachment points and positioning.
-
-Your task: Given component dimensions, calculate realistic positioning that ensures:
-1. Proper structural attachment points
-2. No interference between components
-3. Aerodynamically sound positioning
-4. Center of gravity balance
-5. Real-world engineering practices
-
-Return precise positioning data as JSON."""
+        system_prompt = _SYSTEM_PROMPT_ASSEMBLY
 
         # Extract component parameters for AI analysis
         wings_params = components_data.get('wings', {}).get('parameters', {})
@@ -311,27 +546,17 @@ Return JSON with this exact structure:
 }}"""
 
         try:
-            response = self.client.chat.completions.create(
-                model=settings.openai_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
+            assembly_data = await cached_chat(
+                self.client, settings.openai_model, system_prompt, user_prompt,
                 temperature=0.2,  # Low temperature for precise calculations
-                response_format={"type": "json_object"}
+                prompt_cache_key="aero-assembly-v1"
             )
-
-            content = response.choices[0].message.content
-            if not content:
-                raise ValueError("Empty response from OpenAI for assembly calculation")
-
-            assembly_data = json.loads(content)
-            print(f"AI calculated assembly positioning: {assembly_data}")
+            logger.debug("AI calculated assembly positioning: %r", assembly_data)
 
             return assembly_data
 
-        except Exception as e:
-            print(f"Error calculating intelligent assembly: {e}")
+        except Exception:
+            logger.exception("Error calculating intelligent assembly, using default positioning")
             # Fallback to safe default positioning
             return {
                 "wing_attachment": {
@@ -360,6 +585,26 @@ Return JSON with this exact structure:
             }
 
 
+    def _edit_messages(self, prompt: str, current_aircraft: dict) -> tuple[str, str]:
+        """Build the (system, user) prompts for parsing an edit command."""
+        system_prompt = _SYSTEM_PROMPT_EDIT
+
+        # Include current component parameters for context
+        wings_params = current_aircraft.get('wings', {}).get('parameters', {})
+        fuselage_params = current_aircraft.get('fuselage', {}).get('parameters', {})
+        engines_params = current_aircraft.get('engines', {}).get('parameters', {})
+
+        user_prompt = f"""Parse this edit command: "{prompt}"
+
+Current aircraft state:
+WINGS: span={wings_params.get('span', 0)}m, root_chord={wings_params.get('root_chord', 0)}m, sweep={wings_params.get('sweep_angle', 0)}°
+FUSELAGE: length={fuselage_params.get('fuselage_length', 0)}m, diameter={fuselage_params.get('fuselage_diameter', 0)}m
+ENGINES: length={engines_params.get('engine_length', 0)}m, diameter={engines_params.get('engine_diameter', 0)}m
+
+Return the edit instruction as JSON."""
+        return system_prompt, user_prompt
+
+    @_single_flight("edit")
     async def parse_edit_command(self, prompt: str, current_aircraft: dict) -> dict:
         """
         Parse natural language edit commands to modify existing components.
@@ -381,98 +626,25 @@ Return JSON with this exact structure:
                 "parameters": {...}
             }
         """
-        system_prompt = """You are an aerospace engineering assistant. Parse natural language commands to edit aircraft components.
-
-Your task: Interpret edit commands and return structured edit instructions.
-
-COMPONENT IDENTIFICATION:
-- "wings" / "wing" → component: "wings"
-- "fuselage" / "body" / "cabin" → component: "fuselage"
-- "engines" / "engine" / "nacelle" → component: "engines"
-
-OPERATION TYPES:
-
-1. SCALE (size changes):
-   - "make bigger", "increase size", "scale up" → scale: 1.2 (20% bigger)
-   - "make smaller", "decrease size", "scale down" → scale: 0.8 (20% smaller)
-   - "double the size" → scale: 2.0
-   - "half the size" → scale: 0.5
-
-2. ROTATE (orientation changes):
-   - "rotate X degrees" → rotation: X degrees
-   - "rotate clockwise/counterclockwise" → rotation: ±15 degrees
-   - Specify axis if mentioned, default to Y axis (yaw)
-
-3. TRANSLATE (position changes):
-   - "move forward" → translate_x: +2.0
-   - "move backward/back" → translate_x: -2.0
-   - "move up" → translate_y: +1.0
-   - "move down" → translate_y: -1.0
-   - "move left" → translate_z: -2.0
-   - "move right" → translate_z: +2.0
-
-4. PARAMETER (specific parameter changes):
-   - "set span to X meters" → parameter: "span", value: X
-   - "set chord to X" → parameter: "root_chord", value: X
-   - "change sweep angle to X" → parameter: "sweep_angle", value: X
-
-Return JSON with this exact structure:
-{
-  "component": "wings|fuselage|engines",
-  "operation": "scale|rotate|translate|parameter",
-  "parameters": {
-    // For scale:
-    "scale_factor": 1.2,
-    // For rotate:
-    "rotation_degrees": 45,
-    "rotation_axis": "x|y|z",
-    // For translate:
-    "translate_x": 2.0,
-    "translate_y": 0.0,
-    "translate_z": 0.0,
-    // For parameter:
-    "parameter_name": "span",
-    "parameter_value": 80
-  },
-  "description": "human-readable description of what will happen"
-}"""
+        snapshot = self._aircraft_snapshot(current_aircraft)
+        cached = self._prompt_cache.get("edit", prompt, snapshot)
+        if cached is not None:
+            return cached
 
-        # Include current component parameters for context
-        wings_params = current_aircraft.get('wings', {}).get('parameters', {})
-        fuselage_params = current_aircraft.get('fuselage', {}).get('parameters', {})
-        engines_params = current_aircraft.get('engines', {}).get('parameters', {})
-
-        user_prompt = f"""Parse this edit command: "{prompt}"
-
-Current aircraft state:
-WINGS: span={wings_params.get('span', 0)}m, root_chord={wings_params.get('root_chord', 0)}m, sweep={wings_params.get('sweep_angle', 0)}°
-FUSELAGE: length={fuselage_params.get('fuselage_length', 0)}m, diameter={fuselage_params.get('fuselage_diameter', 0)}m
-ENGINES: length={engines_params.get('engine_length', 0)}m, diameter={engines_params.get('engine_diameter', 0)}m
-
-Return the edit instruction as JSON."""
+        system_prompt, user_prompt = self._edit_messages(prompt, current_aircraft)
 
         try:
-            response = self.client.chat.completions.create(
-                model=settings.openai_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.2,
-                response_format={"type": "json_object"}
+            edit_instruction = await cached_chat(
+                self.client, settings.openai_model, system_prompt, user_prompt,
+                temperature=0.2, prompt_cache_key="aero-edit-v1"
             )
+            logger.debug("AI parsed edit command: %r", edit_instruction)
 
-            content = response.choices[0].message.content
-            if not content:
-                raise ValueError("Empty response from OpenAI for edit command")
-
-            edit_instruction = json.loads(content)
-            print(f"AI parsed edit command: {edit_instruction}")
-
+            self._prompt_cache.put("edit", prompt, edit_instruction, snapshot)
             return edit_instruction
 
         except Exception as e:
-            print(f"Error parsing edit command: {e}")
+            logger.warning("Error parsing edit command: %s", e)
             raise
 
 
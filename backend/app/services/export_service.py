@@ -1,28 +1,93 @@
-import trimesh
+import struct
 import numpy as np
-from io import BytesIO
+from typing import Iterator
 from app.models import Model3D, ExportOptions
 
+# Triangles serialized per streamed chunk (50 bytes each in binary STL)
+STL_CHUNK_TRIANGLES = 8192
+
+# Vertex or face lines formatted per streamed OBJ chunk
+OBJ_CHUNK_LINES = 4096
+
+STL_HEADER = b"AeroCraft binary STL".ljust(80, b"\0")
+
+# One binary STL triangle record: normal, 3 vertices, attribute byte count (50 bytes)
+STL_RECORD_DTYPE = np.dtype([
+    ('normal', '<f4', 3),
+    ('vertices', '<f4', (3, 3)),
+    ('attr', '<u2')
+])
+
 
 class ExportService:
     def export_stl(self, model: Model3D, options: ExportOptions = None) -> bytes:
         """
         Export model to STL format (binary or ASCII).
+        Binary output is built in a single vectorized pass over all triangles.
         """
         options = options or ExportOptions()
 
-        # Reconstruct trimesh from model geometry
-        vertices = np.array(model.geometry.vertices).reshape(-1, 3)
-        faces = np.array(model.geometry.indices).reshape(-1, 3)
+        vertices, faces = self._stl_arrays(model)
+
+        if options.binary is False:
+            # Imported lazily: only ASCII STL needs trimesh, which is slow to import
+            import trimesh
+
+            mesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+            return trimesh.exchange.stl.export_stl_ascii(mesh).encode()
+
+        return STL_HEADER + struct.pack("<I", len(faces)) + self._stl_records(vertices, faces).tobytes()
+
+    def iter_stl(self, model: Model3D, options: ExportOptions = None) -> Iterator[bytes]:
+        """
+        Export model to binary STL as a stream of chunks.
+
+        Yields the 80-byte header, the uint32 triangle count and then the
+        50-byte triangle records in chunks of STL_CHUNK_TRIANGLES, so the
+        whole file is never held in memory.
+        Geometry is validated eagerly so errors surface before streaming starts.
+        """
+        vertices, faces = self._stl_arrays(model)
+        return self._iter_stl_chunks(vertices, faces)
+
+    def _iter_stl_chunks(self, vertices: np.ndarray, faces: np.ndarray) -> Iterator[bytes]:
+        yield STL_HEADER
+        yield struct.pack("<I", len(faces))
 
-        mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
+        for start in range(0, len(faces), STL_CHUNK_TRIANGLES):
+            yield self._stl_records(vertices, faces[start:start + STL_CHUNK_TRIANGLES]).tobytes()
 
-        # Export to BytesIO
-        output = BytesIO()
-        mesh.export(output, file_type='stl', file_obj=output)
-        output.seek(0)
+    def _stl_arrays(self, model: Model3D) -> tuple[np.ndarray, np.ndarray]:
+        """Model geometry as (N, 3) float32 vertices and (M, 3) face indices."""
+        vertices = np.asarray(model.geometry.vertices, dtype=np.float32).reshape(-1, 3)
+        faces = np.asarray(model.geometry.indices, dtype=np.int64).reshape(-1, 3)
 
-        return output.getvalue()
+        if len(faces) and (faces.min() < 0 or faces.max() >= len(vertices)):
+            raise ValueError("Model geometry has face indices outside the vertex buffer")
+
+        return vertices, faces
+
+    def _stl_records(self, vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+        """
+        Build binary STL triangle records for the given faces.
+
+        Args:
+            vertices: (N, 3) float32 vertex positions
+            faces: (M, 3) vertex indices
+
+        Returns:
+            np.ndarray: (M,) array of STL_RECORD_DTYPE
+        """
+        triangles = vertices[faces]
+
+        normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        normals = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+
+        records = np.zeros(len(faces), dtype=STL_RECORD_DTYPE)
+        records['normal'] = normals
+        records['vertices'] = triangles
+        return records
 
     def export_step(self, model: Model3D, options: ExportOptions = None) -> bytes:
         """
@@ -52,16 +117,27 @@ class ExportService:
         """
         Export model to OBJ format (additional format).
         """
-        vertices = np.array(model.geometry.vertices).reshape(-1, 3)
-        faces = np.array(model.geometry.indices).reshape(-1, 3)
+        return b"".join(self.iter_obj(model))
 
-        mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
+    def iter_obj(self, model: Model3D) -> Iterator[bytes]:
+        """
+        Export model to OBJ as a stream of chunks.
+
+        Yields "v" lines and then 1-based "f" lines, formatted
+        OBJ_CHUNK_LINES at a time from numpy slices.
+        Geometry is validated eagerly so errors surface before streaming starts.
+        """
+        vertices, faces = self._stl_arrays(model)
+        return self._iter_obj_chunks(vertices, faces)
 
-        output = BytesIO()
-        mesh.export(output, file_type='obj', file_obj=output)
-        output.seek(0)
+    def _iter_obj_chunks(self, vertices: np.ndarray, faces: np.ndarray) -> Iterator[bytes]:
+        for start in range(0, len(vertices), OBJ_CHUNK_LINES):
+            chunk = vertices[start:start + OBJ_CHUNK_LINES]
+            yield (("v %.8g %.8g %.8g\n" * len(chunk)) % tuple(chunk.ravel().tolist())).encode()
 
-        return output.getvalue()
+        for start in range(0, len(faces), OBJ_CHUNK_LINES):
+            chunk = faces[start:start + OBJ_CHUNK_LINES] + 1
+            yield (("f %d %d %d\n" * len(chunk)) % tuple(chunk.ravel().tolist())).encode()
 
 
 export_service = ExportService()
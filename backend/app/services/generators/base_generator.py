@@ -3,9 +3,16 @@ Abstract base class for aircraft component generators.
 Follows Single Responsibility Principle - each generator handles one component type.
 """
 from abc import ABC, abstractmethod
-import trimesh
+from functools import lru_cache
+import math
+from typing import TYPE_CHECKING
+import numpy as np
 from app.models import AeroParameters
 
+if TYPE_CHECKING:
+    # Imported lazily where meshes are built (trimesh takes ~0.5 s to import)
+    import trimesh
+
 
 class ComponentGenerator(ABC):
     """
@@ -20,7 +27,7 @@ class ComponentGenerator(ABC):
     """
 
     @abstractmethod
-    def generate(self, params: AeroParameters) -> trimesh.Trimesh:
+    def generate(self, params: AeroParameters) -> "trimesh.Trimesh":
         """
         Generate 3D mesh for this component type.
 
@@ -54,3 +61,193 @@ class ComponentGenerator(ABC):
             str: Component type identifier
         """
         pass
+
+    @staticmethod
+    def _ring_vertices(x: np.ndarray, radius: np.ndarray, num_segments: int) -> np.ndarray:
+        """
+        Build circular cross-section rings along the X axis in one pass.
+
+        Args:
+            x: X position of each ring, shape (R,)
+            radius: Radius of each ring, shape (R,)
+            num_segments: Vertices per ring
+
+        Returns:
+            np.ndarray: float32 vertices, shape (R * num_segments, 3), ring by ring
+        """
+        cos_t, sin_t = _ring_trig(num_segments)
+
+        vertices = np.empty((len(x), num_segments, 3), dtype=np.float32)
+        vertices[..., 0] = np.asarray(x)[:, None]
+        vertices[..., 1] = np.asarray(radius)[:, None] * cos_t
+        vertices[..., 2] = np.asarray(radius)[:, None] * sin_t
+        return vertices.reshape(-1, 3)
+
+    @staticmethod
+    def _airfoil_surface(
+        half_span: float,
+        root_chord: float,
+        tip_chord: float,
+        sweep_rad: float,
+        thickness_ratio: float,
+        num_span: int,
+        num_chord: int
+    ) -> tuple:
+        """
+        Lay out a swept, linearly tapered airfoil grid shared by wings and stabilizers.
+
+        Callers map the spanwise positions and surface heights onto their own
+        axes (and apply dihedral) - the chordwise layout is the same for both.
+
+        Args:
+            half_span: Length of the surface from root to tip
+            root_chord: Chord length at the root
+            tip_chord: Chord length at the tip
+            sweep_rad: Sweep angle in radians
+            thickness_ratio: Airfoil thickness as ratio (0-1)
+            num_span: Number of spanwise stations
+            num_chord: Number of chord positions per station
+
+        Returns:
+            tuple: (span, x, upper) - spanwise position of each station, shape (S,);
+            chordwise position centered on the root chord, shape (S, C); and
+            upper-surface height, shape (S, C). The lower surface is -upper * 0.5.
+        """
+        t = np.arange(num_span) / (num_span - 1)  # 0 to 1 from root to tip
+        span = half_span * t
+
+        # Chord at each span position (linear taper)
+        chord = root_chord + (tip_chord - root_chord) * t
+
+        # Sweep offset
+        x_sweep = span * math.tan(sweep_rad)
+
+        # Airfoil profile at every span position
+        x_chord, profile = _airfoil_profile(num_chord)  # 0 to 1 along chord
+        x = x_sweep[:, None] + x_chord * chord[:, None] - root_chord / 2  # Center on the root chord
+
+        upper = thickness_ratio * chord[:, None] * profile
+        return span, x, upper
+
+    @staticmethod
+    def _airfoil_faces(num_span: int, num_chord: int) -> np.ndarray:
+        """
+        Triangulate an airfoil surface grid with flat root and tip caps.
+
+        Vertices are laid out station by station, with upper and lower surface
+        vertices interleaved along the chord (see the wing generators). The
+        connectivity only depends on the grid size, so the template is built
+        once per (num_span, num_chord) and copied for each mesh.
+
+        Faces are wound so their normals point out of the airfoil, which makes a
+        trimesh fix_normals pass unnecessary.
+
+        Args:
+            num_span: Number of spanwise stations
+            num_chord: Vertices per surface along the chord
+
+        Returns:
+            np.ndarray: int32 faces - four per grid quad (upper, then lower
+            surface), followed by the root cap and the tip cap
+        """
+        return _airfoil_face_template(num_span, num_chord).copy()
+
+    @staticmethod
+    def _ring_faces(num_rings: int, num_segments: int) -> np.ndarray:
+        """
+        Triangulate the quads between consecutive rings built by _ring_vertices.
+
+        Faces are wound so their normals point away from the X axis, which
+        makes a trimesh fix_normals pass unnecessary.
+
+        The connectivity only depends on the grid size, so the index template is
+        built once per (num_rings, num_segments) and copied for each mesh.
+
+        Args:
+            num_rings: Number of rings (R)
+            num_segments: Vertices per ring
+
+        Returns:
+            np.ndarray: int32 faces, shape ((R - 1) * num_segments * 2, 3)
+        """
+        return _ring_face_template(num_rings, num_segments).copy()
+
+
+@lru_cache(maxsize=16)
+def _ring_trig(num_segments: int) -> tuple:
+    angles = 2 * np.pi * np.arange(num_segments) / num_segments
+    cos_t = np.cos(angles)
+    sin_t = np.sin(angles)
+    cos_t.flags.writeable = False
+    sin_t.flags.writeable = False
+    return cos_t, sin_t
+
+
+@lru_cache(maxsize=16)
+def _airfoil_profile(num_chord: int) -> tuple:
+    """
+    Chord positions (0 to 1) and normalized upper-surface height of the simple airfoil.
+
+    The height rises linearly to 0.6 over the first 30% of the chord, stays flat
+    to 60% and falls linearly to zero at the trailing edge.
+    """
+    x_chord = np.arange(num_chord) / (num_chord - 1)
+    profile = np.where(
+        x_chord < 0.3, 0.6 * x_chord / 0.3,
+        np.where(x_chord < 0.6, 0.6, 0.6 * (1 - x_chord) / 0.4)
+    )
+    x_chord.flags.writeable = False
+    profile.flags.writeable = False
+    return x_chord, profile
+
+
+@lru_cache(maxsize=16)
+def _airfoil_face_template(num_span: int, num_chord: int) -> np.ndarray:
+    row = num_chord * 2
+    idx = np.arange(num_span - 1)[:, None] * row + np.arange(num_chord - 1) * 2
+
+    # Upper surface (even indices) and lower surface (odd indices), per quad,
+    # wound counter-clockwise seen from outside so normals point outward
+    surfaces = np.stack([
+        np.stack([idx + row, idx + 2, idx], axis=-1),
+        np.stack([idx + row, idx + row + 2, idx + 2], axis=-1),
+        np.stack([idx + 3, idx + row + 1, idx + 1], axis=-1),
+        np.stack([idx + row + 3, idx + row + 1, idx + 3], axis=-1)
+    ], axis=-2).reshape(-1, 3)
+
+    # Flat caps closing the root and tip stations
+    root = np.arange(num_chord - 1) * 2
+    root_cap = np.stack([
+        np.stack([root + 2, root + 1, root], axis=-1),
+        np.stack([root + 2, root + 3, root + 1], axis=-1)
+    ], axis=-2).reshape(-1, 3)
+
+    tip = (num_span - 1) * row + root
+    tip_cap = np.stack([
+        np.stack([tip + 1, tip + 2, tip], axis=-1),
+        np.stack([tip + 3, tip + 2, tip + 1], axis=-1)
+    ], axis=-2).reshape(-1, 3)
+
+    faces = np.concatenate([surfaces, root_cap, tip_cap]).astype(np.int32)
+    faces.flags.writeable = False  # Shared template - callers get copies
+    return faces
+
+
+@lru_cache(maxsize=16)
+def _ring_face_template(num_rings: int, num_segments: int) -> np.ndarray:
+    j = np.arange(num_segments)
+    j1 = (j + 1) % num_segments
+    i = np.arange(num_rings - 1)[:, None] * num_segments
+
+    current = i + j
+    next_in_ring = i + j1
+    next_ring = i + num_segments + j
+    next_ring_next = i + num_segments + j1
+
+    # Counter-clockwise seen from outside, so normals point outward
+    faces = np.stack([
+        np.stack([next_in_ring, next_ring, current], axis=-1),
+        np.stack([next_ring_next, next_ring, next_in_ring], axis=-1)
+    ], axis=-2).reshape(-1, 3).astype(np.int32)
+    faces.flags.writeable = False  # Shared template - callers get copies
+    return faces
@@ -2,12 +2,18 @@
 Engine component generator.
 Single Responsibility: Generates only engine nacelle geometry.
 """
+import logging
+from typing import TYPE_CHECKING
 import numpy as np
-import trimesh
-import sys
 from app.models import AeroParameters
 from app.services.generators.base_generator import ComponentGenerator
 
+if TYPE_CHECKING:
+    # Imported lazily where meshes are built (trimesh takes ~0.5 s to import)
+    import trimesh
+
+logger = logging.getLogger(__name__)
+
 
 class EngineGenerator(ComponentGenerator):
     """
@@ -31,7 +37,7 @@ class EngineGenerator(ComponentGenerator):
             return False
         return True
 
-    def generate(self, params: AeroParameters) -> trimesh.Trimesh:
+    def generate(self, params: AeroParameters) -> "trimesh.Trimesh":
         """Generate engine nacelle mesh."""
         if not self.validate_parameters(params):
             raise ValueError("Invalid engine parameters")
@@ -43,62 +49,47 @@ class EngineGenerator(ComponentGenerator):
         num_segments = 24  # Circular cross-section
         num_length_segments = 20
 
-        vertices = []
-        faces = []
-
-        # Generate engine from intake to exhaust
-        for i in range(num_length_segments + 1):
-            t = i / num_length_segments  # 0 (intake) to 1 (exhaust)
-            x = (t - 0.5) * length  # Center at origin
-
-            # Variable radius for realistic engine shape
-            radius = self._calculate_radius_at_position(t, diameter)
-
-            # Create circular cross-section
-            for j in range(num_segments):
-                angle = 2 * np.pi * j / num_segments
-                y = radius * np.cos(angle)
-                z = radius * np.sin(angle)
-                vertices.append([x, y, z])
+        # Ring positions from intake to exhaust, centered at origin
+        t_arr = np.arange(num_length_segments + 1) / num_length_segments
+        x_arr = (t_arr - 0.5) * length
+        radius_arr = self._radius_profile(t_arr, diameter)
 
-        # Generate faces connecting the rings
-        for i in range(num_length_segments):
-            for j in range(num_segments):
-                current = i * num_segments + j
-                next_in_ring = i * num_segments + (j + 1) % num_segments
-                next_ring = (i + 1) * num_segments + j
-                next_ring_next = (i + 1) * num_segments + (j + 1) % num_segments
+        # Circular cross-sections for every ring at once
+        vertices_array = self._ring_vertices(x_arr, radius_arr, num_segments)
 
-                faces.append([current, next_ring, next_in_ring])
-                faces.append([next_in_ring, next_ring, next_ring_next])
+        # Faces connecting the rings
+        faces_array = self._ring_faces(num_length_segments + 1, num_segments)
 
-        vertices_array = np.array(vertices, dtype=np.float32)
-        faces_array = np.array(faces, dtype=np.int32)
+        import trimesh
 
-        mesh = trimesh.Trimesh(vertices=vertices_array, faces=faces_array)
-        mesh.fix_normals()
+        # Every ring has a non-zero radius, so there are no duplicate vertices for
+        # trimesh to merge - skip its processing pass
+        mesh = trimesh.Trimesh(vertices=vertices_array, faces=faces_array, process=False)
 
-        print(f"[ENGINE GENERATOR] Created single engine with {len(vertices_array)} vertices, {len(faces_array)} faces", file=sys.stderr, flush=True)
-        print(f"[ENGINE GENERATOR] X range: {vertices_array[:, 0].min()} to {vertices_array[:, 0].max()}", file=sys.stderr, flush=True)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[ENGINE GENERATOR] Created single engine with %d vertices, %d faces",
+                len(vertices_array), len(faces_array)
+            )
+            logger.debug(
+                "[ENGINE GENERATOR] X range: %s to %s", vertices_array[:, 0].min(), vertices_array[:, 0].max()
+            )
 
         return mesh
 
-    def _calculate_radius_at_position(self, t: float, diameter: float) -> float:
+    def _radius_profile(self, t: np.ndarray, diameter: float) -> np.ndarray:
         """
-        Calculate engine radius at normalized position t (0 to 1).
+        Calculate engine radius at normalized positions t (0 to 1).
 
         Args:
-            t: Normalized position along engine (0=intake, 1=exhaust)
+            t: Normalized positions along engine (0=intake, 1=exhaust)
             diameter: Maximum engine diameter
 
         Returns:
-            float: Radius at this position
+            np.ndarray: Radius at each position
         """
         radius_base = diameter / 2
 
-        if t < 0.2:  # Intake - larger for air intake
-            return radius_base * (1 + 0.3 * (1 - t / 0.2))
-        elif t > 0.8:  # Exhaust nozzle - tapered for thrust
-            return radius_base * (0.9 - 0.2 * (t - 0.8) / 0.2)
-        else:  # Main engine body - cylindrical
-            return radius_base
+        intake = radius_base * (1 + 0.3 * (1 - t / 0.2))  # Larger for air intake
+        exhaust = radius_base * (0.9 - 0.2 * (t - 0.8) / 0.2)  # Tapered nozzle for thrust
+        return np.where(t < 0.2, intake, np.where(t > 0.8, exhaust, radius_base))
@@ -2,11 +2,15 @@
 Fuselage component generator.
 Single Responsibility: Generates only fuselage geometry.
 """
+from typing import TYPE_CHECKING
 import numpy as np
-import trimesh
 from app.models import AeroParameters
 from app.services.generators.base_generator import ComponentGenerator
 
+if TYPE_CHECKING:
+    # Imported lazily where meshes are built (trimesh takes ~0.5 s to import)
+    import trimesh
+
 
 class FuselageGenerator(ComponentGenerator):
     """
@@ -32,7 +36,7 @@ class FuselageGenerator(ComponentGenerator):
             return False
         return True
 
-    def generate(self, params: AeroParameters) -> trimesh.Trimesh:
+    def generate(self, params: AeroParameters) -> "trimesh.Trimesh":
         """Generate fuselage mesh based on type."""
         if not self.validate_parameters(params):
             raise ValueError("Invalid fuselage parameters")
@@ -45,89 +49,55 @@ class FuselageGenerator(ComponentGenerator):
         num_segments = 32
         num_length_segments = 30
 
-        vertices = []
-        faces = []
-
-        # Generate fuselage from nose to tail
-        for i in range(num_length_segments + 1):
-            t = i / num_length_segments  # 0 (nose) to 1 (tail)
-            x = (t - 0.5) * length  # Center at origin
-
-            # Type-specific radius calculation
-            radius = self._calculate_radius_at_position(t, diameter, fuselage_type)
-
-            # Create circular cross-section
-            for j in range(num_segments):
-                angle = 2 * np.pi * j / num_segments
-                y = radius * np.cos(angle)
-                z = radius * np.sin(angle)
-                vertices.append([x, y, z])
+        # Ring positions from nose to tail, centered at origin
+        t_arr = np.arange(num_length_segments + 1) / num_length_segments
+        x_arr = (t_arr - 0.5) * length
+        radius_arr = self._radius_profile(t_arr, diameter, fuselage_type)
 
-        # Generate faces connecting the rings
-        for i in range(num_length_segments):
-            for j in range(num_segments):
-                current = i * num_segments + j
-                next_in_ring = i * num_segments + (j + 1) % num_segments
-                next_ring = (i + 1) * num_segments + j
-                next_ring_next = (i + 1) * num_segments + (j + 1) % num_segments
+        # Circular cross-sections for every ring at once
+        vertices_array = self._ring_vertices(x_arr, radius_arr, num_segments)
 
-                faces.append([current, next_ring, next_in_ring])
-                faces.append([next_in_ring, next_ring, next_ring_next])
+        # Faces connecting the rings
+        faces_array = self._ring_faces(num_length_segments + 1, num_segments)
 
-        vertices_array = np.array(vertices, dtype=np.float32)
-        faces_array = np.array(faces, dtype=np.int32)
+        import trimesh
 
         mesh = trimesh.Trimesh(vertices=vertices_array, faces=faces_array)
-        mesh.fix_normals()
 
         return mesh
 
-    def _calculate_radius_at_position(self, t: float, diameter: float, fuselage_type: str) -> float:
+    def _radius_profile(self, t: np.ndarray, diameter: float, fuselage_type: str) -> np.ndarray:
         """
-        Calculate fuselage radius at normalized position t (0 to 1).
+        Calculate fuselage radius at normalized positions t (0 to 1).
 
         Args:
-            t: Normalized position along fuselage (0=nose, 1=tail)
+            t: Normalized positions along fuselage (0=nose, 1=tail)
             diameter: Maximum fuselage diameter
             fuselage_type: Type of fuselage shape
 
         Returns:
-            float: Radius at this position
+            np.ndarray: Radius at each position
         """
         radius_base = diameter / 2
 
+        # (nose end, nose exponent, tail start, tail exponent) per type
         if fuselage_type == 'fighter':
             # Fighter jet: very sharp nose, sleek body, tapered tail
-            if t < 0.2:  # Sharp nose
-                return radius_base * (t / 0.2) ** 1.5
-            elif t > 0.8:  # Tapered tail
-                return radius_base * ((1 - t) / 0.2) ** 1.2
-            else:  # Streamlined body
-                return radius_base * (1 - 0.1 * abs(0.5 - t))
-
+            nose_end, nose_exp, tail_start, tail_exp = 0.2, 1.5, 0.8, 1.2
+            body = radius_base * (1 - 0.1 * np.abs(0.5 - t))  # Streamlined body
         elif fuselage_type == 'cargo':
-            # Cargo: boxy, wide, minimal taper
-            if t < 0.1:  # Short nose
-                return radius_base * (t / 0.1) ** 0.3
-            elif t > 0.9:  # Short tail
-                return radius_base * ((1 - t) / 0.1) ** 0.3
-            else:  # Wide boxy body
-                return radius_base
-
+            # Cargo: boxy, wide, minimal taper (short nose and tail)
+            nose_end, nose_exp, tail_start, tail_exp = 0.1, 0.3, 0.9, 0.3
+            body = radius_base
         elif fuselage_type == 'private':
             # Private: sleek, streamlined, medium taper
-            if t < 0.12:  # Smooth nose
-                return radius_base * (t / 0.12) ** 0.6
-            elif t > 0.88:  # Smooth tail
-                return radius_base * ((1 - t) / 0.12) ** 0.8
-            else:  # Streamlined body
-                return radius_base
-
+            nose_end, nose_exp, tail_start, tail_exp = 0.12, 0.6, 0.88, 0.8
+            body = radius_base
         else:  # commercial (default)
             # Commercial: cylindrical with gentle nose and tail cones
-            if t < 0.15:  # Nose cone
-                return radius_base * (t / 0.15) ** 0.5
-            elif t > 0.85:  # Tail cone
-                return radius_base * ((1 - t) / 0.15) ** 0.7
-            else:  # Main cylindrical body
-                return radius_base
+            nose_end, nose_exp, tail_start, tail_exp = 0.15, 0.5, 0.85, 0.7
+            body = radius_base
+
+        nose = radius_base * (t / nose_end) ** nose_exp
+        tail = radius_base * ((1 - t) / (1 - tail_start)) ** tail_exp
+        return np.where(t < nose_end, nose, np.where(t > tail_start, tail, body))
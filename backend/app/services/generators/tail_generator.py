@@ -2,11 +2,16 @@
 Tail assembly component generator.
 Single Responsibility: Generates only tail geometry (horizontal + vertical stabilizers).
 """
+import math
+from typing import TYPE_CHECKING
 import numpy as np
-import trimesh
 from app.models import AeroParameters
 from app.services.generators.base_generator import ComponentGenerator
 
+if TYPE_CHECKING:
+    # Imported lazily where meshes are built (trimesh takes ~0.5 s to import)
+    import trimesh
+
 
 class TailGenerator(ComponentGenerator):
     """
@@ -32,27 +37,26 @@ class TailGenerator(ComponentGenerator):
             return False
         return True
 
-    def generate(self, params: AeroParameters) -> trimesh.Trimesh:
+    def generate(self, params: AeroParameters) -> "trimesh.Trimesh":
         """Generate tail assembly mesh with both stabilizers."""
         if not self.validate_parameters(params):
             raise ValueError("Invalid tail parameters")
 
-        meshes = []
-
         # 1. Horizontal stabilizer (smaller wing-like structure)
-        horizontal_mesh = self._create_horizontal_stabilizer(params)
-        meshes.append(horizontal_mesh)
+        h_vertices, h_faces = self._create_horizontal_stabilizer(params)
 
         # 2. Vertical stabilizer (fin)
-        vertical_mesh = self._create_vertical_stabilizer(params)
-        meshes.append(vertical_mesh)
+        v_vertices, v_faces = self._create_vertical_stabilizer(params)
+
+        # Combine both stabilizers into one mesh (fin faces index past the horizontal vertices)
+        vertices = np.concatenate([h_vertices, v_vertices])
+        faces = np.concatenate([h_faces, v_faces + len(h_vertices)])
 
-        # Combine both stabilizers into one mesh
-        combined_mesh = trimesh.util.concatenate(meshes)
+        import trimesh
 
-        return combined_mesh
+        return trimesh.Trimesh(vertices=vertices, faces=faces)
 
-    def _create_horizontal_stabilizer(self, params: AeroParameters) -> trimesh.Trimesh:
+    def _create_horizontal_stabilizer(self, params: AeroParameters) -> tuple:
         """
         Create horizontal stabilizer (proportional to main wing).
 
@@ -60,20 +64,20 @@ class TailGenerator(ComponentGenerator):
             params: Base aircraft parameters
 
         Returns:
-            trimesh.Trimesh: Horizontal stabilizer mesh
+            tuple: Horizontal stabilizer (vertices, faces) arrays
         """
-        # Scale parameters for horizontal stabilizer (60% of main wing)
-        h_stab_params = params.model_copy()
-        h_stab_params.span = params.span * 0.6
-        h_stab_params.root_chord = params.root_chord * 0.4
-        h_stab_params.tip_chord = params.tip_chord * 0.4 if params.tip_chord else params.root_chord * 0.2
-        h_stab_params.sweep_angle = params.sweep_angle * 0.7
-        h_stab_params.thickness = params.thickness * 0.8
-
-        # Generate using same airfoil logic as wings
-        return self._create_stabilizer_wing(h_stab_params)
-
-    def _create_vertical_stabilizer(self, params: AeroParameters) -> trimesh.Trimesh:
+        # Scale parameters for horizontal stabilizer (60% of main wing),
+        # generated using same airfoil logic as wings
+        return self._create_stabilizer_wing(
+            span=params.span * 0.6,
+            root_chord=params.root_chord * 0.4,
+            tip_chord=params.tip_chord * 0.4 if params.tip_chord else params.root_chord * 0.2,
+            sweep_angle=params.sweep_angle * 0.7,
+            thickness=params.thickness * 0.8,
+            dihedral=params.dihedral
+        )
+
+    def _create_vertical_stabilizer(self, params: AeroParameters) -> tuple:
         """
         Create vertical stabilizer (fin).
 
@@ -81,142 +85,86 @@ class TailGenerator(ComponentGenerator):
             params: Base aircraft parameters
 
         Returns:
-            trimesh.Trimesh: Vertical stabilizer mesh (rotated 90 degrees)
+            tuple: Vertical stabilizer (vertices, faces) arrays (rotated 90 degrees)
         """
-        # Scale parameters for vertical stabilizer (50% of main wing)
-        v_stab_params = params.model_copy()
-        v_stab_params.span = params.span * 0.5  # Becomes height
-        v_stab_params.root_chord = params.root_chord * 0.5
-        v_stab_params.tip_chord = params.tip_chord * 0.3 if params.tip_chord else params.root_chord * 0.2
-        v_stab_params.sweep_angle = params.sweep_angle * 0.8
-        v_stab_params.thickness = params.thickness * 0.9
-        v_stab_params.dihedral = 0  # No dihedral for vertical stabilizer
-
-        # Create wing-like structure
-        vertical_mesh = self._create_stabilizer_wing(v_stab_params)
-
-        # Rotate 90 degrees around X-axis to make it vertical
-        rotation_matrix = trimesh.transformations.rotation_matrix(
-            np.pi / 2,  # 90 degrees
-            [1, 0, 0]   # Around X-axis
+        # Create wing-like structure scaled for vertical stabilizer (50% of main wing)
+        vertices, faces = self._create_stabilizer_wing(
+            span=params.span * 0.5,  # Becomes height
+            root_chord=params.root_chord * 0.5,
+            tip_chord=params.tip_chord * 0.3 if params.tip_chord else params.root_chord * 0.2,
+            sweep_angle=params.sweep_angle * 0.8,
+            thickness=params.thickness * 0.9,
+            dihedral=0  # No dihedral for vertical stabilizer
         )
-        vertical_mesh.apply_transform(rotation_matrix)
 
-        # Position above horizontal stabilizer (T-tail configuration)
-        vertical_mesh.vertices[:, 2] += params.span * 0.15
-
-        return vertical_mesh
+        # Rotate 90 degrees around X-axis to make it vertical: an exact axis swap,
+        # (x, y, z) -> (x, -z, y), so no 4x4 matmul (or trig round-off) is needed
+        rotated = np.empty(vertices.shape)
+        rotated[:, 0] = vertices[:, 0]
+        rotated[:, 1] = -vertices[:, 2]
 
-    def _create_stabilizer_wing(self, params: AeroParameters) -> trimesh.Trimesh:
+        # Position above horizontal stabilizer (T-tail configuration)
+        rotated[:, 2] = vertices[:, 1] + params.span * 0.15
+
+        return rotated, faces
+
+    def _create_stabilizer_wing(
+        self,
+        span: float,
+        root_chord: float,
+        tip_chord: float,
+        sweep_angle: float,
+        thickness: float,
+        dihedral: float
+    ) -> tuple:
         """
         Create a simple wing-like structure for stabilizers.
         Simplified version of wing generation for tail components.
 
+        Takes the scaled stabilizer dimensions directly, so no parameters
+        model has to be copied and re-validated per stabilizer.
+
         Args:
-            params: Stabilizer parameters
+            span: Stabilizer span
+            root_chord: Chord length at the root
+            tip_chord: Chord length at the tip
+            sweep_angle: Sweep angle in degrees
+            thickness: Airfoil thickness as percentage of chord
+            dihedral: Dihedral angle in degrees
 
         Returns:
-            trimesh.Trimesh: Stabilizer wing mesh
+            tuple: Stabilizer (vertices, faces) arrays
         """
-        half_span = params.span / 2
-        root_chord = params.root_chord
-        tip_chord = params.tip_chord or 0.1
-        thickness_ratio = params.thickness / 100
-        sweep_rad = np.radians(params.sweep_angle)
-        dihedral_rad = np.radians(params.dihedral)
+        half_span = span / 2
+        tip_chord = tip_chord or 0.1
+        thickness_ratio = thickness / 100
+        sweep_rad = math.radians(sweep_angle)
+        dihedral_rad = math.radians(dihedral)
 
         # Airfoil profile resolution (lower than main wing for performance)
         num_chord = 15
         num_span = 12
 
-        vertices = []
-        faces = []
-
-        # Generate vertices for upper and lower surfaces
-        for i in range(num_span):
-            t = i / (num_span - 1)  # 0 to 1 from root to tip
-
-            # Current span position
-            y = half_span * t
-            y_dihedral = y * np.sin(dihedral_rad)
-            z_dihedral = y * (1 - np.cos(dihedral_rad))
-
-            # Chord at this span position (linear taper)
-            chord = root_chord + (tip_chord - root_chord) * t
-
-            # Sweep offset
-            x_sweep = y * np.tan(sweep_rad)
-
-            # Generate airfoil profile
-            for j in range(num_chord):
-                x_chord = j / (num_chord - 1)  # 0 to 1 along chord
-                x = x_sweep + x_chord * chord - root_chord / 2
-
-                # Simple airfoil shape
-                if x_chord < 0.3:
-                    z_upper = thickness_ratio * chord * (0.6 * x_chord / 0.3)
-                elif x_chord < 0.6:
-                    z_upper = thickness_ratio * chord * 0.6
-                else:
-                    z_upper = thickness_ratio * chord * 0.6 * (1 - x_chord) / 0.4
-
-                z_lower = -z_upper * 0.5  # Asymmetric airfoil
-
-                # Upper surface
-                vertices.append([x, y_dihedral, z_dihedral + z_upper])
-                # Lower surface
-                vertices.append([x, y_dihedral, z_dihedral + z_lower])
-
-        vertices_array = np.array(vertices, dtype=np.float32)
-
-        # Generate faces
-        for i in range(num_span - 1):
-            for j in range(num_chord - 1):
-                idx = i * num_chord * 2 + j * 2
-
-                # Upper surface triangles
-                v1 = idx
-                v2 = idx + 2
-                v3 = idx + num_chord * 2
-                v4 = idx + num_chord * 2 + 2
-
-                faces.append([v1, v2, v3])
-                faces.append([v2, v4, v3])
-
-                # Lower surface triangles
-                v1_l = idx + 1
-                v2_l = idx + 3
-                v3_l = idx + num_chord * 2 + 1
-                v4_l = idx + num_chord * 2 + 3
-
-                faces.append([v1_l, v3_l, v2_l])
-                faces.append([v2_l, v3_l, v4_l])
-
-        # Add root edge cap
-        for j in range(num_chord - 1):
-            upper_curr = j * 2
-            lower_curr = j * 2 + 1
-            upper_next = (j + 1) * 2
-            lower_next = (j + 1) * 2 + 1
-
-            faces.append([upper_curr, lower_curr, upper_next])
-            faces.append([lower_curr, lower_next, upper_next])
-
-        # Add tip edge cap
-        tip_start = (num_span - 1) * num_chord * 2
-        for j in range(num_chord - 1):
-            upper_curr = tip_start + j * 2
-            lower_curr = tip_start + j * 2 + 1
-            upper_next = tip_start + (j + 1) * 2
-            lower_next = tip_start + (j + 1) * 2 + 1
-
-            faces.append([upper_curr, upper_next, lower_curr])
-            faces.append([lower_curr, upper_next, lower_next])
-
-        faces_array = np.array(faces, dtype=np.int32)
-
-        # Create trimesh
-        mesh = trimesh.Trimesh(vertices=vertices_array, faces=faces_array)
-        mesh.fix_normals()
-
-        return mesh
+        y, x, z_upper = self._airfoil_surface(
+            half_span, root_chord, tip_chord, sweep_rad, thickness_ratio, num_span, num_chord
+        )
+        z_lower = -z_upper * 0.5  # Asymmetric airfoil
+
+        # Span along Y, bent up by dihedral
+        y_dihedral = y * math.cos(dihedral_rad)
+        z_dihedral = y * math.sin(dihedral_rad)
+
+        # Upper and lower surface vertex interleaved per station: [span, chord, upper/lower, xyz]
+        vertices = np.empty((num_span, num_chord, 2, 3), dtype=np.float32)
+        vertices[..., 0] = x[..., None]
+        vertices[..., 1] = y_dihedral[:, None, None]
+        vertices[:, :, 0, 2] = z_dihedral[:, None] + z_upper
+        vertices[:, :, 1, 2] = z_dihedral[:, None] + z_lower
+        vertices_array = vertices.reshape(-1, 3)
+
+        # Faces for both surfaces plus root and tip caps. The template is wound for the
+        # wing layout (span along Z, thickness along Y); swapping those axes mirrors the
+        # surface, so the winding is reversed to keep normals outward
+        faces_array = self._airfoil_faces(num_span, num_chord)[:, ::-1]
+
+        return vertices_array, faces_array
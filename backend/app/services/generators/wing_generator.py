@@ -2,12 +2,19 @@
 Wing component generator.
 Single Responsibility: Generates only wing geometry.
 """
+import logging
+import math
+from typing import TYPE_CHECKING
 import numpy as np
-import trimesh
-import sys
 from app.models import AeroParameters
 from app.services.generators.base_generator import ComponentGenerator
 
+if TYPE_CHECKING:
+    # Imported lazily where meshes are built (trimesh takes ~0.5 s to import)
+    import trimesh
+
+logger = logging.getLogger(__name__)
+
 
 class WingGenerator(ComponentGenerator):
     """
@@ -20,6 +27,14 @@ class WingGenerator(ComponentGenerator):
     - Validate wing-specific parameters
     """
 
+    # Builder method for each wing type, dispatched with one dict lookup
+    _WING_BUILDERS = {
+        "delta": "_create_delta_wing",
+        "swept": "_create_swept_wing",
+        "straight": "_create_straight_wing",
+        "tapered": "_create_tapered_wing"
+    }
+
     def get_component_type(self) -> str:
         return "wing"
 
@@ -29,11 +44,11 @@ class WingGenerator(ComponentGenerator):
             return False
         if params.root_chord <= 0:
             return False
-        if params.wing_type not in ['delta', 'swept', 'straight', 'tapered']:
+        if params.wing_type not in self._WING_BUILDERS:
             return False
         return True
 
-    def generate(self, params: AeroParameters) -> trimesh.Trimesh:
+    def generate(self, params: AeroParameters) -> "trimesh.Trimesh":
         """
         Generate wing mesh based on wing type with distinct geometric characteristics.
 
@@ -47,18 +62,12 @@ class WingGenerator(ComponentGenerator):
             raise ValueError("Invalid wing parameters")
 
         # Route to specialized generation methods
-        if params.wing_type == "straight":
-            return self._create_straight_wing(params)
-        elif params.wing_type == "delta":
-            return self._create_delta_wing(params)
-        elif params.wing_type == "swept":
-            return self._create_swept_wing(params)
-        elif params.wing_type == "tapered":
-            return self._create_tapered_wing(params)
-        else:
+        builder = self._WING_BUILDERS.get(params.wing_type)
+        if builder is None:
             raise ValueError(f"Unknown wing type: {params.wing_type}")
+        return getattr(self, builder)(params)
 
-    def _create_delta_wing(self, params: AeroParameters) -> trimesh.Trimesh:
+    def _create_delta_wing(self, params: AeroParameters) -> "trimesh.Trimesh":
         """
         Create delta wing with high sweep and aggressive taper.
 
@@ -79,21 +88,21 @@ class WingGenerator(ComponentGenerator):
         # DELTA WING: Apply characteristic geometry
         # Override sweep angle for delta characteristics (if not specified realistically)
         if params.sweep_angle < 45:  # If user/AI gave low sweep, enforce delta characteristics
-            sweep_rad = np.radians(55)  # Typical delta sweep: 50-60°
-            print(f"[DELTA WING] Enforcing characteristic sweep: 55° (was {params.sweep_angle}°)", file=sys.stderr, flush=True)
+            sweep_rad = math.radians(55)  # Typical delta sweep: 50-60°
+            logger.debug("[DELTA WING] Enforcing characteristic sweep: 55° (was %s°)", params.sweep_angle)
         else:
-            sweep_rad = np.radians(params.sweep_angle)
+            sweep_rad = math.radians(params.sweep_angle)
 
         # DELTA WING: Aggressive taper (tip is 10-20% of root for sharp triangular shape)
         if params.tip_chord and params.tip_chord > root_chord * 0.3:
             # User specified non-delta taper, enforce delta characteristics
             tip_chord = root_chord * 0.15  # 15% taper for sharp delta
-            print(f"[DELTA WING] Enforcing characteristic taper: tip={tip_chord:.3f}m (15% of root)", file=sys.stderr, flush=True)
+            logger.debug("[DELTA WING] Enforcing characteristic taper: tip=%.3fm (15%% of root)", tip_chord)
         else:
             tip_chord = params.tip_chord or (root_chord * 0.15)
 
         thickness_ratio = params.thickness / 100
-        dihedral_rad = np.radians(params.dihedral)
+        dihedral_rad = math.radians(params.dihedral)
 
         # Use the shared mesh generation logic
         return self._generate_wing_mesh(
@@ -106,7 +115,7 @@ class WingGenerator(ComponentGenerator):
             wing_type="DELTA"
         )
 
-    def _create_swept_wing(self, params: AeroParameters) -> trimesh.Trimesh:
+    def _create_swept_wing(self, params: AeroParameters) -> "trimesh.Trimesh":
         """
         Create swept wing with moderate sweep and minimal taper.
 
@@ -124,21 +133,21 @@ class WingGenerator(ComponentGenerator):
         # SWEPT WING: Apply characteristic geometry
         # Moderate sweep angle (25-35° typical for commercial aircraft)
         if params.sweep_angle > 40 or params.sweep_angle < 20:
-            sweep_rad = np.radians(30)  # Typical swept wing: 25-35°
-            print(f"[SWEPT WING] Enforcing characteristic sweep: 30° (was {params.sweep_angle}°)", file=sys.stderr, flush=True)
+            sweep_rad = math.radians(30)  # Typical swept wing: 25-35°
+            logger.debug("[SWEPT WING] Enforcing characteristic sweep: 30° (was %s°)", params.sweep_angle)
         else:
-            sweep_rad = np.radians(params.sweep_angle)
+            sweep_rad = math.radians(params.sweep_angle)
 
         # SWEPT WING: Minimal taper (tip is 60-80% of root for efficiency)
         if params.tip_chord and (params.tip_chord < root_chord * 0.5 or params.tip_chord > root_chord * 0.9):
             # User specified non-swept taper, enforce swept characteristics
             tip_chord = root_chord * 0.70  # 70% taper for typical swept wing
-            print(f"[SWEPT WING] Enforcing characteristic taper: tip={tip_chord:.3f}m (70% of root)", file=sys.stderr, flush=True)
+            logger.debug("[SWEPT WING] Enforcing characteristic taper: tip=%.3fm (70%% of root)", tip_chord)
         else:
             tip_chord = params.tip_chord or (root_chord * 0.70)
 
         thickness_ratio = params.thickness / 100
-        dihedral_rad = np.radians(params.dihedral)
+        dihedral_rad = math.radians(params.dihedral)
 
         # Use the same mesh generation logic as delta wing
         # (The geometry generation code is shared, only parameters differ)
@@ -152,7 +161,7 @@ class WingGenerator(ComponentGenerator):
             wing_type="SWEPT"
         )
 
-    def _create_tapered_wing(self, params: AeroParameters) -> trimesh.Trimesh:
+    def _create_tapered_wing(self, params: AeroParameters) -> "trimesh.Trimesh":
         """
         Create tapered wing with no sweep and moderate taper.
 
@@ -175,12 +184,12 @@ class WingGenerator(ComponentGenerator):
         if params.tip_chord and (params.tip_chord < root_chord * 0.2 or params.tip_chord > root_chord * 0.6):
             # User specified non-tapered ratio, enforce tapered characteristics
             tip_chord = root_chord * 0.40  # 40% taper for typical tapered wing
-            print(f"[TAPERED WING] Enforcing characteristic taper: tip={tip_chord:.3f}m (40% of root)", file=sys.stderr, flush=True)
+            logger.debug("[TAPERED WING] Enforcing characteristic taper: tip=%.3fm (40%% of root)", tip_chord)
         else:
             tip_chord = params.tip_chord or (root_chord * 0.40)
 
         thickness_ratio = params.thickness / 100
-        dihedral_rad = np.radians(params.dihedral)
+        dihedral_rad = math.radians(params.dihedral)
 
         # Use the same mesh generation logic
         return self._generate_wing_mesh(
@@ -193,7 +202,7 @@ class WingGenerator(ComponentGenerator):
             wing_type="TAPERED"
         )
 
-    def _create_straight_wing(self, params: AeroParameters) -> trimesh.Trimesh:
+    def _create_straight_wing(self, params: AeroParameters) -> "trimesh.Trimesh":
         """
         Create straight wing with no sweep and no taper (rectangular).
 
@@ -213,7 +222,7 @@ class WingGenerator(ComponentGenerator):
         tip_chord = root_chord  # Rectangular: constant chord
 
         thickness_ratio = params.thickness / 100
-        dihedral_rad = np.radians(params.dihedral)
+        dihedral_rad = math.radians(params.dihedral)
 
         # Use the same mesh generation logic
         return self._generate_wing_mesh(
@@ -235,7 +244,7 @@ class WingGenerator(ComponentGenerator):
         dihedral_rad: float,
         thickness_ratio: float,
         wing_type: str
-    ) -> trimesh.Trimesh:
+    ) -> "trimesh.Trimesh":
         """
         Core mesh generation logic shared by all wing types.
         Separated for DRY principle and easier maintenance.
@@ -256,99 +265,37 @@ class WingGenerator(ComponentGenerator):
         num_chord = 20
         num_span = 15
 
-        vertices = []
-        faces = []
-
-        # Generate vertices for upper and lower surfaces (single wing half only)
         # COORDINATE SYSTEM: X=chord (front-back), Y=thickness (up-down), Z=span (left-right)
-        for i in range(num_span):
-            t = i / (num_span - 1)  # 0 to 1 from root to tip
-
-            # Current span position (along Z-axis for left-right extension)
-            z = half_span * t
-            z_dihedral = z * np.cos(dihedral_rad)
-            y_dihedral = z * np.sin(dihedral_rad)
-
-            # Chord at this span position (linear taper)
-            chord = root_chord + (tip_chord - root_chord) * t
-
-            # Sweep offset (along X-axis)
-            x_sweep = z * np.tan(sweep_rad)
-
-            # Generate airfoil profile at this span position
-            for j in range(num_chord):
-                x_chord = (j / (num_chord - 1))  # 0 to 1 along chord
-                x = x_sweep + x_chord * chord - root_chord / 2  # Center the wing
-
-                # Simple airfoil shape (approximation) - thickness along Y-axis
-                if x_chord < 0.3:
-                    y_upper = thickness_ratio * chord * (0.6 * x_chord / 0.3)
-                elif x_chord < 0.6:
-                    y_upper = thickness_ratio * chord * 0.6
-                else:
-                    y_upper = thickness_ratio * chord * 0.6 * (1 - x_chord) / 0.4
-
-                y_lower = -y_upper * 0.5  # Asymmetric airfoil
-
-                # Upper surface: X=chord, Y=thickness (up), Z=span
-                vertices.append([x, y_dihedral + y_upper, z_dihedral])
-                # Lower surface
-                vertices.append([x, y_dihedral + y_lower, z_dihedral])
-
-        vertices_array = np.array(vertices, dtype=np.float32)
-
-        # Generate faces (triangles) for single wing half only
-        for i in range(num_span - 1):
-            for j in range(num_chord - 1):
-                # Indices for quad
-                idx = i * num_chord * 2 + j * 2
-
-                # Upper surface triangles
-                v1 = idx
-                v2 = idx + 2
-                v3 = idx + num_chord * 2
-                v4 = idx + num_chord * 2 + 2
-
-                faces.append([v1, v2, v3])
-                faces.append([v2, v4, v3])
-
-                # Lower surface triangles
-                v1_l = idx + 1
-                v2_l = idx + 3
-                v3_l = idx + num_chord * 2 + 1
-                v4_l = idx + num_chord * 2 + 3
-
-                faces.append([v1_l, v3_l, v2_l])
-                faces.append([v2_l, v3_l, v4_l])
-
-        # Add root edge cap (flat vertical surface at fuselage attachment)
-        for j in range(num_chord - 1):
-            upper_curr = j * 2
-            lower_curr = j * 2 + 1
-            upper_next = (j + 1) * 2
-            lower_next = (j + 1) * 2 + 1
-
-            faces.append([upper_curr, lower_curr, upper_next])
-            faces.append([lower_curr, lower_next, upper_next])
-
-        # Add tip edge cap
-        tip_start = (num_span - 1) * num_chord * 2
-        for j in range(num_chord - 1):
-            upper_curr = tip_start + j * 2
-            lower_curr = tip_start + j * 2 + 1
-            upper_next = tip_start + (j + 1) * 2
-            lower_next = tip_start + (j + 1) * 2 + 1
-
-            faces.append([upper_curr, upper_next, lower_curr])
-            faces.append([lower_curr, upper_next, lower_next])
-
-        faces_array = np.array(faces, dtype=np.int32)
+        z, x, y_upper = self._airfoil_surface(
+            half_span, root_chord, tip_chord, sweep_rad, thickness_ratio, num_span, num_chord
+        )
+        y_lower = -y_upper * 0.5  # Asymmetric airfoil
+
+        # Dihedral raises the span (along Z-axis for left-right extension)
+        z_dihedral = z * math.cos(dihedral_rad)
+        y_dihedral = z * math.sin(dihedral_rad)
+
+        # Upper and lower surface vertex interleaved per station: [span, chord, upper/lower, xyz]
+        vertices = np.empty((num_span, num_chord, 2, 3), dtype=np.float32)
+        vertices[..., 0] = x[..., None]
+        vertices[:, :, 0, 1] = y_dihedral[:, None] + y_upper
+        vertices[:, :, 1, 1] = y_dihedral[:, None] + y_lower
+        vertices[..., 2] = z_dihedral[:, None, None]
+        vertices_array = vertices.reshape(-1, 3)
+
+        # Faces for both surfaces plus root and tip caps
+        faces_array = self._airfoil_faces(num_span, num_chord)
+
+        import trimesh
 
         # Create trimesh
         mesh = trimesh.Trimesh(vertices=vertices_array, faces=faces_array)
-        mesh.fix_normals()
 
-        print(f"[{wing_type} WING] Generated mesh with {len(vertices_array)} vertices, {len(faces_array)} faces", file=sys.stderr, flush=True)
-        print(f"[{wing_type} WING] Span={half_span*2:.2f}m, Root chord={root_chord:.2f}m, Tip chord={tip_chord:.2f}m", file=sys.stderr, flush=True)
+        logger.debug(
+            "[%s WING] Generated mesh with %d vertices, %d faces", wing_type, len(vertices_array), len(faces_array)
+        )
+        logger.debug(
+            "[%s WING] Span=%.2fm, Root chord=%.2fm, Tip chord=%.2fm", wing_type, half_span * 2, root_chord, tip_chord
+        )
 
         return mesh
@@ -2,19 +2,107 @@
 Refactored Geometry Service using SOLID principles.
 Delegates component generation to specialized generators.
 """
+import asyncio
+import base64
+import logging
+import re
+from functools import lru_cache
 import numpy as np
-import trimesh
-from typing import Tuple
-from app.models import AeroParameters, GeometryData, Model3D, ModelMetadata
+from typing import NamedTuple, Optional, Tuple
+from app.models import AeroParameters, EncodedGeometry, GeometryData, Model3D, ModelMetadata
 from datetime import datetime
 import uuid
-import sys
 
 # Import generator factory for component generation
 from app.services.generators import GeneratorFactory
 # Import AI service for intelligent assembly
 from app.services import ai_service
 
+logger = logging.getLogger(__name__)
+
+# Generated component geometries kept for repeated identical parameters
+GEOMETRY_CACHE_MAX = 256
+
+# Per-axis scale mirroring geometry across the XZ plane (left wing from right)
+_MIRROR_Y = np.array([1.0, -1.0, 1.0])
+
+# 90 degree rotation around the Y-axis that turns engines horizontal (exact, no trig round-off)
+_ENGINE_ROTATION = np.array([
+    [0.0, 0.0, 1.0, 0.0],
+    [0.0, 1.0, 0.0, 0.0],
+    [-1.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 1.0]
+])
+
+# Prompt keywords naming a component type, matched in a single scan of the prompt
+_COMPONENT_KEYWORDS = re.compile(r"fuselage|body|engine|nacelle|turbine|wing")
+_KEYWORD_TO_TYPE = {
+    "fuselage": "fuselage",
+    "body": "fuselage",
+    "engine": "engine",
+    "nacelle": "engine",
+    "turbine": "engine",
+    "wing": "wing"
+}
+
+
+def _unit_rows(vectors: np.ndarray) -> np.ndarray:
+    lengths = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, lengths, out=np.zeros_like(vectors), where=lengths > 0)
+
+
+def _vertex_normals(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """
+    Angle-weighted vertex normals (same weighting as trimesh's vertex_normals).
+
+    Each face normal is computed once and scattered onto its three corners with a
+    single bincount, weighted by the triangle's angle at that corner.
+
+    Args:
+        vertices: (N, 3) vertex positions
+        faces: (M, 3) vertex indices
+
+    Returns:
+        np.ndarray: (N, 3) unit normals (zero for unreferenced vertices)
+    """
+    triangles = vertices[faces]
+    edge_01 = triangles[:, 1] - triangles[:, 0]
+    edge_02 = triangles[:, 2] - triangles[:, 0]
+    edge_12 = triangles[:, 2] - triangles[:, 1]
+    face_normals = _unit_rows(np.cross(edge_01, edge_02))
+
+    unit_01, unit_02, unit_12 = _unit_rows(edge_01), _unit_rows(edge_02), _unit_rows(edge_12)
+    angles = np.empty(faces.shape)
+    angles[:, 0] = np.arccos(np.clip(np.einsum('ij,ij->i', unit_01, unit_02), -1.0, 1.0))
+    angles[:, 1] = np.arccos(np.clip(-np.einsum('ij,ij->i', unit_01, unit_12), -1.0, 1.0))
+    angles[:, 2] = np.pi - angles[:, 0] - angles[:, 1]
+
+    # One flat bincount over (vertex, axis) slots instead of np.add.at per corner
+    weighted = face_normals[:, None, :] * angles[:, :, None]
+    slots = (faces.reshape(-1, 1) * 3 + np.arange(3)).ravel()
+    sums = np.bincount(slots, weights=weighted.ravel(), minlength=len(vertices) * 3)
+    return _unit_rows(sums.reshape(-1, 3))
+
+
+# Assembly role of the component names sent by the API (see _COMPONENT_ORDER in api/generation.py)
+_ASSEMBLY_ROLES = {"wings": "wing", "fuselage": "fuselage", "engines": "engine"}
+
+
+def _assembly_role(component_name: str) -> Optional[str]:
+    """Map a component name to "wing", "fuselage" or "engine" (None if it is none of them)."""
+    role = _ASSEMBLY_ROLES.get(component_name)
+    if role is None:
+        # Other spellings ("Left Wing", "engine_pod", ...) fall back to keyword matching
+        name = component_name.lower()
+        role = next((keyword for keyword in ("wing", "fuselage", "engine") if keyword in name), None)
+    return role
+
+
+class _RawMesh(NamedTuple):
+    """Bare vertex/face buffers of a component during assembly (no trimesh caches or validation)."""
+    vertices: np.ndarray  # (N, 3) float64
+    faces: np.ndarray  # (M, 3) vertex indices
+
 
 class GeometryService:
     """
@@ -35,12 +123,16 @@ class GeometryService:
     def __init__(self):
         """Initialize geometry service with generator factory."""
         self.generator_factory = GeneratorFactory
+        # Parameters are frozen (hashable), and GeometryData is immutable, so results can be shared
+        self._generate_geometry = lru_cache(maxsize=GEOMETRY_CACHE_MAX)(self._build_geometry)
 
     def create_model_from_parameters(
         self,
         params: AeroParameters,
         source_prompt: str = None,
-        generated_from: str = "text"
+        generated_from: str = "text",
+        include_normals: bool = True,
+        component: Optional[str] = None
     ) -> Model3D:
         """
         Create a complete Model3D from parameters.
@@ -49,47 +141,38 @@ class GeometryService:
             params: Component parameters
             source_prompt: Original text prompt (optional)
             generated_from: Generation source ("text", "manual", etc.)
+            include_normals: Compute vertex normals (skip when the model is only
+                compiled, since assembly computes its own)
+            component: Component name when already known ("wings", "fuselage",
+                "engines"); skips detecting the type from the prompt
 
         Returns:
             Model3D: Complete 3D model with geometry and metadata
         """
         # Determine component type and get appropriate generator
-        component_type = self._determine_component_type(params, source_prompt)
-
-        print(f"DEBUG: source_prompt='{source_prompt}'", file=sys.stderr, flush=True)
-        print(f"DEBUG: determined component_type='{component_type}'", file=sys.stderr, flush=True)
-
-        # Get generator from factory
-        generator = self.generator_factory.create(component_type)
-
-        if not generator:
-            raise ValueError(f"No generator available for component type: {component_type}")
+        component_type = _assembly_role(component) if component else None
+        component_type = component_type or self._determine_component_type(params, source_prompt)
 
-        # Generate mesh using specialized generator
-        print(f"DEBUG: Generating {component_type.upper()} mesh using {generator.__class__.__name__}", file=sys.stderr, flush=True)
-        mesh = generator.generate(params)
+        logger.debug("source_prompt=%r, determined component_type=%r", source_prompt, component_type)
 
-        # Convert to geometry data
-        geometry = GeometryData(
-            vertices=mesh.vertices.flatten().tolist(),
-            indices=mesh.faces.flatten().tolist(),
-            normals=mesh.vertex_normals.flatten().tolist()
-        )
+        # Generate geometry (reused when these parameters were built before)
+        geometry = self._generate_geometry(component_type, params, include_normals)
 
         # Create metadata
+        now = datetime.now()
         metadata = ModelMetadata(
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
             generated_from=generated_from,
             source_prompt=source_prompt
         )
 
         # Determine component name
-        component_name = self._determine_component_name(params, source_prompt)
+        component_name = self._determine_component_name(params, source_prompt, component_type)
 
         # Create model
         model = Model3D(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             name=component_name,
             parameters=params,
             geometry=geometry,
@@ -98,6 +181,42 @@ class GeometryService:
 
         return model
 
+    def _build_geometry(
+        self,
+        component_type: str,
+        params: AeroParameters,
+        include_normals: bool = True
+    ) -> GeometryData:
+        """
+        Generate a component mesh and convert it to geometry data.
+
+        Args:
+            component_type: Generator type ("wing", "fuselage", "engine")
+            params: Component parameters
+            include_normals: Compute vertex normals
+
+        Returns:
+            GeometryData: Generated geometry
+        """
+        # Get generator from factory
+        generator = self.generator_factory.create(component_type)
+
+        if not generator:
+            raise ValueError(f"No generator available for component type: {component_type}")
+
+        # Generate mesh using specialized generator
+        logger.debug("Generating %s mesh using %s", component_type.upper(), type(generator).__name__)
+        mesh = generator.generate(params)
+
+        # Convert to geometry data (normals computed straight from the buffers,
+        # bypassing trimesh's face-normal/adjacency caches)
+        vertices, faces = mesh.vertices, mesh.faces
+        return GeometryData.from_arrays(
+            vertices=vertices,
+            indices=faces,
+            normals=_vertex_normals(vertices, faces) if include_normals else None
+        )
+
     def _determine_component_type(self, params: AeroParameters, source_prompt: str = None) -> str:
         """
         Determine the component type (wing, fuselage, engine) based on parameters and prompt.
@@ -113,12 +232,10 @@ class GeometryService:
         prompt_lower = (source_prompt or "").lower()
 
         # Check prompt for explicit component type keywords (highest priority)
-        if "fuselage" in prompt_lower or "body" in prompt_lower:
-            return "fuselage"
-        elif "engine" in prompt_lower or "nacelle" in prompt_lower or "turbine" in prompt_lower:
-            return "engine"
-        elif "wing" in prompt_lower or "wings" in prompt_lower:
-            return "wing"
+        mentioned = {_KEYWORD_TO_TYPE[keyword] for keyword in _COMPONENT_KEYWORDS.findall(prompt_lower)}
+        for component_type in ("fuselage", "engine", "wing"):
+            if component_type in mentioned:
+                return component_type
 
         # MODULAR APPROACH: Check for ENGINE parameters (engine_length, engine_diameter)
         if params.engine_length and params.engine_diameter:
@@ -137,18 +254,24 @@ class GeometryService:
         # Default to wing
         return "wing"
 
-    def _determine_component_name(self, params: AeroParameters, source_prompt: str = None) -> str:
+    def _determine_component_name(
+        self,
+        params: AeroParameters,
+        source_prompt: str = None,
+        component_type: str = None
+    ) -> str:
         """
         Determine the component name based on parameters and source prompt.
 
         Args:
             params: Component parameters
             source_prompt: Original text prompt (optional)
+            component_type: Already determined component type (optional, skips re-detection)
 
         Returns:
             str: Human-readable component name
         """
-        component_type = self._determine_component_type(params, source_prompt)
+        component_type = component_type or self._determine_component_type(params, source_prompt)
 
         if component_type == "fuselage":
             fuselage_type = (params.fuselage_type or "commercial").capitalize()
@@ -171,92 +294,121 @@ class GeometryService:
         Returns:
             Model3D: Compiled aircraft model
         """
-        # Create trimesh objects from components with proper positioning
-        meshes = []
+        # Convert each component off the event loop while the AI positioning call is in flight
+        prepare_tasks = [
+            asyncio.to_thread(self.prepare_component, component, name)
+            for component, name in zip(components, component_names)
+        ]
+        *prepared, assembly_data = await asyncio.gather(
+            *prepare_tasks,
+            ai_service.calculate_intelligent_assembly(aircraft_data or {})
+        )
+        return await self.merge_prepared(prepared, aircraft_data, assembly_data)
+
+    def prepare_component(self, component, component_name: str) -> dict:
+        """
+        Convert a single component model into mesh buffers ready for assembly.
+        Independent of the other components, so it can run in a worker thread.
 
+        Args:
+            component: Component model (Model3D or dict from JSON)
+            component_name: Component type name ("wings", "fuselage", "engines")
+
+        Returns:
+            dict: {"name", "mesh", "parameters"} for merge_prepared
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Component %s type: %s, keys: %s", component_name, type(component),
+                list(component.keys()) if isinstance(component, dict) else "not a dict"
+            )
+
+        # Handle both dict and Model3D object
+        if isinstance(component, dict):
+            geometry = component.get('geometry')
+        else:
+            # Assume it's a Model3D object with .geometry attribute
+            geometry = component.geometry if hasattr(component, 'geometry') else component
+
+        logger.debug("Geometry type: %s", type(geometry))
+
+        # Convert geometry data to numpy arrays
+        # Handle both dict and GeometryData object
+        if isinstance(geometry, dict):
+            vertices_data = geometry['vertices']
+            indices_data = geometry['indices']
+        else:
+            vertices_data = geometry.vertices if hasattr(geometry, 'vertices') else geometry
+            indices_data = geometry.indices if hasattr(geometry, 'indices') else geometry
+
+        vertices = self._coerce_to_ndarray(vertices_data, np.float32, 3)
+        indices = self._coerce_to_ndarray(indices_data, np.int32, 3)
+
+        # Positions are parsed as float32 (the client's precision) and assembled in float64
+        mesh = _RawMesh(vertices.astype(np.float64), indices)
+
+        # Extract parameters for this component
+        if isinstance(component, dict):
+            component_params = component.get('parameters')
+        else:
+            component_params = component.parameters if hasattr(component, 'parameters') else None
+
+        return {
+            "name": component_name,
+            "mesh": mesh,
+            "parameters": component_params
+        }
+
+    async def merge_prepared(
+        self,
+        prepared: list,
+        aircraft_data: dict = None,
+        assembly_data: dict = None
+    ) -> Model3D:
+        """
+        Position prepared component meshes and merge them into one aircraft model.
+
+        Args:
+            prepared: Outputs of prepare_component, in component order
+            aircraft_data: Full aircraft data dict for AI analysis
+            assembly_data: AI positioning already fetched for aircraft_data (optional)
+
+        Returns:
+            Model3D: Compiled aircraft model
+        """
         # Extract component meshes AND their parameters for accurate positioning
         wings_mesh = None
         wings_params = None
         fuselage_mesh = None
         engines_mesh = None
 
-        for i, component in enumerate(components):
-            print(f"DEBUG: Component {i} type: {type(component)}", file=sys.stderr, flush=True)
-            print(f"DEBUG: Component {i} keys: {component.keys() if isinstance(component, dict) else 'not a dict'}", file=sys.stderr, flush=True)
-
-            # Handle both dict and Model3D object
-            if isinstance(component, dict):
-                geometry = component.get('geometry')
-            else:
-                # Assume it's a Model3D object with .geometry attribute
-                geometry = component.geometry if hasattr(component, 'geometry') else component
-
-            print(f"DEBUG: Geometry type: {type(geometry)}", file=sys.stderr, flush=True)
-
-            # Convert geometry data to numpy arrays
-            # Handle both dict and GeometryData object
-            if isinstance(geometry, dict):
-                vertices_data = geometry['vertices']
-                indices_data = geometry['indices']
-            else:
-                vertices_data = geometry.vertices if hasattr(geometry, 'vertices') else geometry
-                indices_data = geometry.indices if hasattr(geometry, 'indices') else geometry
-
-            # Handle case where vertices/indices are dicts with string keys (from JSON)
-            if isinstance(vertices_data, dict):
-                # Convert dict to list by sorting keys numerically
-                vertices_list = [vertices_data[str(i)] for i in sorted([int(k) for k in vertices_data.keys()])]
-                vertices_data = vertices_list
-                print(f"DEBUG: Converted vertices dict to list, length: {len(vertices_list)}", file=sys.stderr, flush=True)
-
-            if isinstance(indices_data, dict):
-                # Convert dict to list by sorting keys numerically
-                indices_list = [indices_data[str(i)] for i in sorted([int(k) for k in indices_data.keys()])]
-                indices_data = indices_list
-                print(f"DEBUG: Converted indices dict to list, length: {len(indices_list)}", file=sys.stderr, flush=True)
-
-            vertices = np.array(vertices_data, dtype=np.float32).reshape(-1, 3)
-            indices = np.array(indices_data, dtype=np.int32).reshape(-1, 3)
-
-            # Create mesh
-            mesh = trimesh.Trimesh(vertices=vertices, faces=indices)
-
-            # Extract parameters for this component
-            if isinstance(component, dict):
-                component_params = component.get('parameters')
-            else:
-                component_params = component.parameters if hasattr(component, 'parameters') else None
-
+        for item in prepared:
             # Assign to appropriate component based on name
-            component_type = component_names[i].lower()
-            if 'wing' in component_type:
-                wings_mesh = mesh
-                wings_params = component_params  # Store wing parameters for engine positioning
-            elif 'fuselage' in component_type:
-                fuselage_mesh = mesh
-            elif 'engine' in component_type:
-                engines_mesh = mesh
+            component_type = _assembly_role(item["name"])
+            if component_type == 'wing':
+                wings_mesh = item["mesh"]
+                wings_params = item["parameters"]  # Store wing parameters for engine positioning
+            elif component_type == 'fuselage':
+                fuselage_mesh = item["mesh"]
+            elif component_type == 'engine':
+                engines_mesh = item["mesh"]
 
         # USE AI TO CALCULATE INTELLIGENT POSITIONING
-        print(f"[AI ASSEMBLY] Calculating intelligent assembly positioning...", file=sys.stderr, flush=True)
-
-        assembly_data = await ai_service.calculate_intelligent_assembly(aircraft_data or {})
+        if assembly_data is None:
+            logger.debug("[AI ASSEMBLY] Calculating intelligent assembly positioning...")
+            assembly_data = await ai_service.calculate_intelligent_assembly(aircraft_data or {})
 
-        print(f"[AI ASSEMBLY] Wing attachment: {assembly_data['wing_attachment']}", file=sys.stderr, flush=True)
-        print(f"[AI ASSEMBLY] Engine attachment: {assembly_data['engine_attachment']}", file=sys.stderr, flush=True)
-        print(f"[AI ASSEMBLY] Interference check: {assembly_data['interference_check']}", file=sys.stderr, flush=True)
-        print(f"[AI ASSEMBLY] Center of gravity: {assembly_data['center_of_gravity']}", file=sys.stderr, flush=True)
+        if logger.isEnabledFor(logging.DEBUG):
+            for key in ('wing_attachment', 'engine_attachment', 'interference_check', 'center_of_gravity'):
+                logger.debug("[AI ASSEMBLY] %s: %s", key, assembly_data.get(key))
 
         # Position components to form a realistic aircraft
         positioned_meshes = []
 
         # 1. Fuselage - center of aircraft (reference point)
+        # Placement comes from the AI assembly data, so the fuselage extent is not needed
         if fuselage_mesh:
             positioned_meshes.append(fuselage_mesh)
-            fuselage_bounds = fuselage_mesh.bounds
-            fuselage_length = fuselage_bounds[1][0] - fuselage_bounds[0][0]
-        else:
-            fuselage_length = 4.0  # Default length if no fuselage
 
         # 2. Wings - attach using AI-calculated position
         # Create left and right wings
@@ -265,23 +417,25 @@ class GeometryService:
             wing_offset_y = assembly_data['wing_attachment']['position_y']
             wing_offset_z = assembly_data['wing_attachment']['position_z']
 
-            print(f"[AI ASSEMBLY] Positioning wings at X={wing_offset_x}, Y={wing_offset_y}, Z={wing_offset_z}", file=sys.stderr, flush=True)
+            logger.debug("[AI ASSEMBLY] Positioning wings at X=%s, Y=%s, Z=%s", wing_offset_x, wing_offset_y, wing_offset_z)
+
+            # Assuming wings_mesh is a single wing, duplicate it for left and right,
+            # written as one stacked buffer pair (right wing first, then left)
+            vertex_count = len(wings_mesh.vertices)
+            wing_vertices = np.empty((2 * vertex_count, 3))
+            wing_faces = np.empty((2 * len(wings_mesh.faces), 3), dtype=wings_mesh.faces.dtype)
 
-            # Assuming wings_mesh is a single wing, duplicate it for left and right
             # Right wing (positive Y)
-            translation_right = trimesh.transformations.translation_matrix([wing_offset_x, wing_offset_y, wing_offset_z])
-            wing_right = wings_mesh.copy()
-            wing_right.apply_transform(translation_right)
-            positioned_meshes.append(wing_right)
-
-            # Left wing (negative Y) - mirror across XZ plane
-            wing_left = wings_mesh.copy()
-            # Mirror by scaling Y by -1
-            mirror_matrix = np.diag([1, -1, 1, 1])
-            wing_left.apply_transform(mirror_matrix)
-            translation_left = trimesh.transformations.translation_matrix([wing_offset_x, -wing_offset_y, wing_offset_z])
-            wing_left.apply_transform(translation_left)
-            positioned_meshes.append(wing_left)
+            np.add(wings_mesh.vertices, [wing_offset_x, wing_offset_y, wing_offset_z], out=wing_vertices[:vertex_count])
+            wing_faces[:len(wings_mesh.faces)] = wings_mesh.faces
+
+            # Left wing (negative Y) - mirror across XZ plane by scaling Y by -1
+            # The mirror flips triangle winding, so faces are reversed to keep normals outward
+            np.multiply(wings_mesh.vertices, _MIRROR_Y, out=wing_vertices[vertex_count:])
+            wing_vertices[vertex_count:] += [wing_offset_x, -wing_offset_y, wing_offset_z]
+            np.add(wings_mesh.faces[:, ::-1], vertex_count, out=wing_faces[len(wings_mesh.faces):])
+
+            positioned_meshes.append(_RawMesh(vertices=wing_vertices, faces=wing_faces))
 
         # 3. Engines - attach using AI-calculated position
         if engines_mesh:
@@ -290,64 +444,58 @@ class GeometryService:
             engine_offset_y = assembly_data['engine_attachment']['position_y']
             engine_offset_z = assembly_data['engine_attachment']['position_z']
 
-            print(f"[AI ASSEMBLY] Positioning engines at X={engine_offset_x}, Y={engine_offset_y}, Z={engine_offset_z}", file=sys.stderr, flush=True)
-
-            # Rotate engine 90 degrees around Y-axis to make it horizontal (pointing forward)
-            rotation_matrix = trimesh.transformations.rotation_matrix(
-                np.radians(90),  # 90 degrees
-                [0, 1, 0]  # Around Y-axis
-            )
-
-            # Left engine
-            translation_left = trimesh.transformations.translation_matrix([engine_offset_x, engine_offset_y, engine_offset_z])
-            engine_left = engines_mesh.copy()
-            engine_left.apply_transform(rotation_matrix)  # Rotate first
-            engine_left.apply_transform(translation_left)  # Then translate
-            positioned_meshes.append(engine_left)
-
-            # Right engine
-            translation_right = trimesh.transformations.translation_matrix([engine_offset_x, -engine_offset_y, engine_offset_z])
-            engine_right = engines_mesh.copy()
-            engine_right.apply_transform(rotation_matrix)  # Rotate first
-            engine_right.apply_transform(translation_right)  # Then translate
-            positioned_meshes.append(engine_right)
+            logger.debug("[AI ASSEMBLY] Positioning engines at X=%s, Y=%s, Z=%s", engine_offset_x, engine_offset_y, engine_offset_z)
+
+            # Left and right engines: rotate 90 degrees around Y-axis (pointing forward), then translate
+            # Both instances share the rotation, so it is applied once and broadcast over
+            # the per-engine translations, giving one (instances, vertices, 3) batch
+            translations = np.array([
+                [engine_offset_x, engine_offset_y, engine_offset_z],
+                [engine_offset_x, -engine_offset_y, engine_offset_z]
+            ])
+            rotated = engines_mesh.vertices @ _ENGINE_ROTATION[:3, :3].T
+            instances = rotated[None] + translations[:, None]
+
+            # Each instance's faces are shifted past the vertices of the instances before it
+            vertex_count = len(engines_mesh.vertices)
+            instance_faces = engines_mesh.faces[None] + (np.arange(len(translations)) * vertex_count)[:, None, None]
+            positioned_meshes.append(_RawMesh(
+                vertices=instances.reshape(-1, 3),
+                faces=instance_faces.reshape(-1, 3)
+            ))
 
         # Combine all positioned meshes
-        if len(positioned_meshes) > 1:
-            combined_mesh = trimesh.util.concatenate(positioned_meshes)
-        elif len(positioned_meshes) == 1:
-            combined_mesh = positioned_meshes[0]
+        if positioned_meshes:
+            # Stack the buffers directly, shifting each mesh's faces past the vertices before it
+            vertex_counts = [len(mesh.vertices) for mesh in positioned_meshes]
+            offsets = np.cumsum([0] + vertex_counts[:-1])
+            combined_vertices = np.vstack([mesh.vertices for mesh in positioned_meshes])
+            combined_faces = np.vstack([mesh.faces + offset for mesh, offset in zip(positioned_meshes, offsets)])
         else:
-            # Fallback: create a simple placeholder
-            combined_mesh = trimesh.creation.box()
+            # Fallback: create a simple placeholder (trimesh is slow to import, so only here)
+            import trimesh
 
-        # Convert combined mesh to geometry data
-        all_vertices = combined_mesh.vertices.flatten().tolist()
-        all_indices = combined_mesh.faces.flatten().tolist()
-
-        # Calculate normals
-        try:
-            all_normals = combined_mesh.vertex_normals.flatten().tolist()
-        except:
-            all_normals = []
+            placeholder = trimesh.creation.box()
+            combined_vertices, combined_faces = placeholder.vertices, placeholder.faces
 
         # Create combined geometry data
-        combined_geometry = GeometryData(
-            vertices=all_vertices,
-            indices=all_indices,
-            normals=all_normals if all_normals else None
+        combined_geometry = GeometryData.from_arrays(
+            vertices=combined_vertices,
+            indices=combined_faces,
+            normals=_vertex_normals(combined_vertices, combined_faces)
         )
 
         # Create metadata
+        now = datetime.now()
         metadata = ModelMetadata(
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
             generated_from="compilation",
-            source_prompt=f"Compiled aircraft from {len(components)} components: {', '.join(component_names)}"
+            source_prompt=f"Compiled aircraft from {len(prepared)} components: {', '.join(item['name'] for item in prepared)}"
         )
 
         # Use first component's parameters as base (or create default)
-        base_params = components[0]['parameters'] if components else AeroParameters(
+        base_params = prepared[0]['parameters'] if prepared else AeroParameters(
             wing_type="compiled",
             span=0,
             root_chord=0,
@@ -358,7 +506,7 @@ class GeometryService:
 
         # Create compiled model
         compiled_model = Model3D(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             name="Complete Aircraft",
             parameters=base_params,
             geometry=combined_geometry,
@@ -367,6 +515,104 @@ class GeometryService:
 
         return compiled_model
 
+    def encode_model(self, model: Model3D, precision: str = "json") -> Model3D:
+        """
+        Return a copy of the model with compact vertex/normal/index buffers for transport.
+
+        Args:
+            model: Model with full-precision geometry (left unchanged)
+            precision: "json" (unchanged full-precision JSON lists), "fp32" (single
+                floats), "fp16" (half floats) or "int16" (positions quantized per
+                axis over the bounding box)
+
+        Returns:
+            Model3D: Model whose geometry carries an EncodedGeometry payload
+            (the model itself for "json")
+        """
+        if precision == "json":
+            return model
+
+        geometry = model.geometry
+        vertices = geometry.vertices.astype(np.float32).reshape(-1, 3)
+        normals = geometry.normals.astype(np.float32) if geometry.normals is not None else None
+
+        # Components stay well under 65536 vertices, so indices usually fit in half the bytes
+        index_type = "uint16" if len(vertices) <= 65536 else "uint32"
+        index_buffer = {
+            "indices": self._to_base64(geometry.indices.astype('<u2' if index_type == "uint16" else '<u4')),
+            "index_type": index_type
+        }
+
+        if precision == "fp32":
+            encoded = EncodedGeometry(
+                precision="fp32",
+                vertices=self._to_base64(vertices.astype('<f4')),
+                normals=self._to_base64(normals.astype('<f4')) if normals is not None else None,
+                **index_buffer
+            )
+        elif precision == "fp16":
+            encoded = EncodedGeometry(
+                precision="fp16",
+                vertices=self._to_base64(vertices.astype('<f2')),
+                normals=self._to_base64(normals.astype('<f2')) if normals is not None else None,
+                **index_buffer
+            )
+        elif precision == "int16":
+            offset = vertices.min(axis=0) if len(vertices) else np.zeros(3, dtype=np.float32)
+            scale = (vertices.max(axis=0) - offset) if len(vertices) else np.zeros(3, dtype=np.float32)
+            safe_scale = np.where(scale > 0, scale, 1.0)
+            quantized = np.rint((vertices - offset) / safe_scale * 65535) - 32768
+            encoded = EncodedGeometry(
+                precision="int16",
+                vertices=self._to_base64(quantized.astype('<i2')),
+                # Unit normals quantize directly onto [-32767, 32767]
+                normals=self._to_base64(np.rint(np.clip(normals, -1, 1) * 32767).astype('<i2')) if normals is not None else None,
+                scale=scale.tolist(),
+                offset=offset.tolist(),
+                **index_buffer
+            )
+        else:
+            raise ValueError(f"Unknown geometry precision: {precision}")
+
+        compact_geometry = GeometryData(vertices=(), indices=(), encoded=encoded)
+        return model.model_copy(update={"geometry": compact_geometry})
+
+    @staticmethod
+    def _coerce_to_ndarray(data, dtype, cols: int) -> np.ndarray:
+        """
+        Convert a geometry buffer in any accepted form to an (N, cols) array.
+
+        Args:
+            data: ndarray, raw or base64 little-endian bytes, flat or nested list,
+                or a dict with string index keys (a JSON-encoded typed array)
+            dtype: Element type of the result
+            cols: Values per row
+
+        Returns:
+            np.ndarray: (N, cols) array
+        """
+        if isinstance(data, str):
+            # Typed arrays sent by the client as base64 buffers
+            data = base64.b64decode(data)
+
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return np.frombuffer(data, dtype=np.dtype(dtype).newbyteorder('<')).reshape(-1, cols)
+
+        if isinstance(data, dict):
+            # JSON objects keep insertion order, so keys are normally already "0".."n-1"
+            # and the values can be read straight into the array in one pass
+            if all(key == str(i) for i, key in enumerate(data)):
+                values = data.values()
+            else:
+                values = (data[key] for key in sorted(data, key=int))
+            return np.fromiter(values, dtype=dtype, count=len(data)).reshape(-1, cols)
+
+        return np.asarray(data, dtype=dtype).reshape(-1, cols)
+
+    @staticmethod
+    def _to_base64(array: np.ndarray) -> str:
+        return base64.b64encode(array.tobytes()).decode("ascii")
+
 
 # Singleton instance
 geometry_service = GeometryService()
@@ -0,0 +1,88 @@
+"""
+Normalized-prompt cache for AI responses.
+
+Prompts that only differ in case, punctuation, spacing or articles
+("Make the wings bigger!" / "make wings bigger") reuse a previous response
+instead of making another OpenAI round trip. Anything else - a different
+wing type, an added "not" - is a different prompt and a miss.
+"""
+import copy
+import json
+import re
+from collections import OrderedDict
+from typing import Any, Optional
+
+_TOKEN_RE = re.compile(r"[a-z]+|\d+(?:\.\d+)?")
+
+# Words dropped before comparing prompts (they never change the request)
+_FILLER_WORDS = frozenset({"a", "an", "the", "please"})
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    Reduce a prompt to its lowercase words and numbers, without filler words.
+
+    Args:
+        prompt: User prompt
+
+    Returns:
+        str: Space-joined normalized tokens
+    """
+    return " ".join(token for token in _TOKEN_RE.findall(prompt.lower()) if token not in _FILLER_WORDS)
+
+
+class PromptCache:
+    """
+    Exact-match cache on normalized prompts with LRU eviction.
+
+    Entries are keyed on the request kind, the normalized prompt and an
+    optional context snapshot, so extract/complete/edit results never mix
+    and an edit only hits for the same aircraft parameters.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+    def get(self, kind: str, prompt: str, context: Any = None) -> Optional[Any]:
+        """
+        Look up a cached result for an equivalent prompt.
+
+        Args:
+            kind: Request kind (separates extract/complete/edit results)
+            prompt: User prompt
+            context: Optional JSON-serializable context the result depends on
+
+        Returns:
+            A copy of the cached result, or None on a miss
+        """
+        key = self._key(kind, prompt, context)
+        if key not in self._entries:
+            return None
+
+        self._entries.move_to_end(key)
+        return copy.deepcopy(self._entries[key])
+
+    def put(self, kind: str, prompt: str, result: Any, context: Any = None) -> None:
+        """
+        Store a result, evicting the least recently used entry when full.
+
+        Args:
+            kind: Request kind
+            prompt: User prompt
+            result: Result to cache (a copy is stored)
+            context: Optional JSON-serializable context the result depends on
+        """
+        key = self._key(kind, prompt, context)
+        self._entries[key] = copy.deepcopy(result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+    @staticmethod
+    def _key(kind: str, prompt: str, context: Any) -> str:
+        return json.dumps([kind, normalize_prompt(prompt), context], sort_keys=True, default=str)
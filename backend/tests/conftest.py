@@ -0,0 +1,7 @@
+"""
+Shared pytest setup for the backend tests.
+"""
+import os
+
+# Settings require an OpenAI key at import time; the tests never call the API
+os.environ.setdefault("OPENAI_API_KEY", "test")
@@ -0,0 +1,73 @@
+"""
+Orientation checks for the procedurally generated component meshes.
+
+The generators wind their faces outward by construction instead of running
+trimesh's fix_normals, so these tests guard the index templates.
+"""
+import numpy as np
+import pytest
+from app.models import AeroParameters
+from app.services.generators import GeneratorFactory, TailGenerator
+
+# Faces with a smaller area are degenerate (e.g. collapsed nose/tail rings)
+_MIN_FACE_AREA = 1e-12
+
+
+def _params(**overrides) -> AeroParameters:
+    values = dict(
+        wing_type="swept",
+        span=30.0,
+        root_chord=5.0,
+        tip_chord=2.0,
+        sweep_angle=30.0,
+        thickness=12.0,
+        dihedral=4.0
+    )
+    values.update(overrides)
+    return AeroParameters(**values)
+
+
+def _assert_faces_point_away_from_x_axis(mesh) -> None:
+    """Every non-degenerate face normal points away from the ring axis (the X axis)."""
+    keep = mesh.area_faces > _MIN_FACE_AREA
+    centers = mesh.triangles_center[keep]
+    axis_points = centers * [1.0, 0.0, 0.0]
+
+    dots = np.einsum("ij,ij->i", mesh.face_normals[keep], centers - axis_points)
+    assert keep.any()
+    assert (dots > 0).all(), f"{(dots <= 0).sum()} faces point toward the axis"
+
+
+@pytest.mark.parametrize("fuselage_type", ["commercial", "fighter", "cargo", "private"])
+def test_fuselage_faces_point_outward(fuselage_type):
+    params = _params(fuselage_length=30.0, fuselage_diameter=4.0, fuselage_type=fuselage_type)
+    mesh = GeneratorFactory.create("fuselage").generate(params)
+
+    _assert_faces_point_away_from_x_axis(mesh)
+
+
+def test_engine_faces_point_outward():
+    params = _params(engine_length=4.0, engine_diameter=2.0)
+    mesh = GeneratorFactory.create("engine").generate(params)
+
+    _assert_faces_point_away_from_x_axis(mesh)
+
+
+def _assert_closed_outward(mesh) -> None:
+    """Neighbouring faces agree on winding and the enclosed volume is positive (normals outward)."""
+    assert mesh.is_winding_consistent
+    assert mesh.volume > 0
+
+
+@pytest.mark.parametrize("wing_type", ["delta", "swept", "straight", "tapered"])
+def test_wing_faces_point_outward(wing_type):
+    mesh = GeneratorFactory.create("wing").generate(_params(wing_type=wing_type))
+
+    _assert_closed_outward(mesh)
+
+
+@pytest.mark.parametrize("dihedral", [0.0, 4.0, -3.0])
+def test_tail_faces_point_outward(dihedral):
+    mesh = TailGenerator().generate(_params(dihedral=dihedral))
+
+    _assert_closed_outward(mesh)
@@ -2,9 +2,96 @@ import type { GenerateResponse, AeroParameters, ExportFormat, Model3D } from '$l
 
 const API_BASE = '/api';
 
+// Decode a base64 little-endian buffer into raw bytes
+function base64ToBytes(data: string): Uint8Array {
+	const binary = atob(data);
+	const bytes = new Uint8Array(binary.length);
+	for (let i = 0; i < binary.length; i++) {
+		bytes[i] = binary.charCodeAt(i);
+	}
+	return bytes;
+}
+
+// Encode raw bytes as base64, a slice at a time to stay within argument limits
+function bytesToBase64(bytes: Uint8Array): string {
+	let binary = '';
+	for (let i = 0; i < bytes.length; i += 0x8000) {
+		binary += String.fromCharCode(...bytes.subarray(i, i + 0x8000));
+	}
+	return btoa(binary);
+}
+
+// JSON.stringify replacer sending typed geometry arrays as base64 little-endian buffers
+// (plain stringify turns them into {"0": ..., "1": ...} objects the backend must re-sort)
+function geometryReplacer(_key: string, value: unknown): unknown {
+	if (value instanceof Float32Array || value instanceof Uint32Array) {
+		return bytesToBase64(new Uint8Array(value.buffer, value.byteOffset, value.byteLength));
+	}
+	return value;
+}
+
+// Convert IEEE 754 half-precision bit patterns to 32-bit floats
+function halfToFloat32(halves: Uint16Array): Float32Array {
+	const out = new Float32Array(halves.length);
+	for (let i = 0; i < halves.length; i++) {
+		const h = halves[i];
+		const sign = h & 0x8000 ? -1 : 1;
+		const exponent = (h >> 10) & 0x1f;
+		const fraction = h & 0x3ff;
+		if (exponent === 0) {
+			out[i] = sign * Math.pow(2, -14) * (fraction / 1024);
+		} else if (exponent === 0x1f) {
+			out[i] = fraction ? NaN : sign * Infinity;
+		} else {
+			out[i] = sign * Math.pow(2, exponent - 15) * (1 + fraction / 1024);
+		}
+	}
+	return out;
+}
+
+// Decode compact fp32/fp16/int16 geometry buffers sent by the backend (geometry.encoded)
+function decodeGeometry(encoded: any): {
+	vertices: Float32Array;
+	indices?: Uint16Array | Uint32Array;
+	normals?: Float32Array;
+} {
+	const decode = (data: string, isPosition: boolean): Float32Array => {
+		const bytes = base64ToBytes(data);
+		if (encoded.precision === 'fp32') {
+			return new Float32Array(bytes.buffer, 0, bytes.byteLength / 4);
+		}
+		if (encoded.precision === 'fp16') {
+			return halfToFloat32(new Uint16Array(bytes.buffer, 0, bytes.byteLength / 2));
+		}
+		const quantized = new Int16Array(bytes.buffer, 0, bytes.byteLength / 2);
+		const out = new Float32Array(quantized.length);
+		for (let i = 0; i < quantized.length; i++) {
+			const axis = i % 3;
+			out[i] = isPosition
+				? ((quantized[i] + 32768) / 65535) * encoded.scale[axis] + encoded.offset[axis]
+				: quantized[i] / 32767;
+		}
+		return out;
+	};
+
+	const decodeIndices = (data: string): Uint16Array | Uint32Array => {
+		const bytes = base64ToBytes(data);
+		return encoded.index_type === 'uint16'
+			? new Uint16Array(bytes.buffer, 0, bytes.byteLength / 2)
+			: new Uint32Array(bytes.buffer, 0, bytes.byteLength / 4);
+	};
+
+	return {
+		vertices: decode(encoded.vertices, true),
+		indices: encoded.indices ? decodeIndices(encoded.indices) : undefined,
+		normals: encoded.normals ? decode(encoded.normals, false) : undefined
+	};
+}
+
 // Helper function to convert backend snake_case to frontend camelCase
 function mapBackendToFrontend(backendData: any): Model3D {
 	const params = backendData.parameters || {};
+	const decoded = backendData.geometry.encoded ? decodeGeometry(backendData.geometry.encoded) : null;
 	return {
 		id: backendData.id,
 		name: backendData.name,
@@ -29,13 +116,13 @@ function mapBackendToFrontend(backendData: any): Model3D {
 		},
 		geometry: {
 			// Convert arrays to Typed Arrays
-			vertices: backendData.geometry.vertices instanceof Float32Array 
+			vertices: decoded ? decoded.vertices : backendData.geometry.vertices instanceof Float32Array 
 				? backendData.geometry.vertices 
 				: new Float32Array(backendData.geometry.vertices),
-			indices: backendData.geometry.indices instanceof Uint32Array 
+			indices: decoded?.indices ?? (backendData.geometry.indices instanceof Uint32Array 
 				? backendData.geometry.indices 
-				: new Uint32Array(backendData.geometry.indices),
-			normals: backendData.geometry.normals 
+				: new Uint32Array(backendData.geometry.indices)),
+			normals: decoded ? decoded.normals : backendData.geometry.normals 
 				? (backendData.geometry.normals instanceof Float32Array 
 					? backendData.geometry.normals 
 					: new Float32Array(backendData.geometry.normals))
@@ -185,7 +272,8 @@ class ApiService {
 			const response = await fetch(`${API_BASE}/generate/compile-aircraft`, {
 				method: 'POST',
 				headers: { 'Content-Type': 'application/json' },
-				body: JSON.stringify({ aircraft })
+				// Compiled model is view-only (exports use the server copy), so request compact int16 geometry
+				body: JSON.stringify({ aircraft, precision: 'int16' }, geometryReplacer)
 			});
 
 			if (!response.ok) {
@@ -224,7 +312,7 @@ class ApiService {
 			const response = await fetch(`${API_BASE}/generate/edit-component`, {
 				method: 'POST',
 				headers: { 'Content-Type': 'application/json' },
-				body: JSON.stringify({ prompt, aircraft })
+				body: JSON.stringify({ prompt, aircraft }, geometryReplacer)
 			});
 
 			if (!response.ok) {
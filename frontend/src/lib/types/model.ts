@@ -33,7 +33,7 @@ export interface Model3D {
 	parameters: AeroParameters;
 	geometry: {
 		vertices: Float32Array;
-		indices: Uint32Array;
+		indices: Uint16Array | Uint32Array;  // uint16 when sent as a compact encoded buffer
 		normals?: Float32Array;
 	};
 	metadata: {